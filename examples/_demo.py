@@ -0,0 +1,130 @@
+"""
+Helpers shared by the example scripts.
+
+The scripts are run directly (``python examples/basic_examples.py``), so
+each one puts the repository root on ``sys.path`` before importing this
+module.
+"""
+
+import asyncio
+import io
+import os
+import sys
+import threading
+import time
+from datetime import timedelta
+from functools import lru_cache
+from typing import Callable, List, Optional, Sequence, Set, TextIO, cast
+
+import arrow
+
+from utils.formatters import DateFormatter
+
+# Seconds to pause between demos (ARROW_DEMO_PACE); 0 runs them unpaced
+PACE = float(os.environ.get('ARROW_DEMO_PACE', '0'))
+SEP = "=" * 60
+
+_HUMANIZE_REF = arrow.Arrow(2000, 1, 1)
+_SECONDS_PER_WEEK = 7 * 24 * 60 * 60
+
+# Each format string the demos use becomes a template named after itself
+_FORMATTER = DateFormatter()
+_TEMPLATES: Set[str] = set()
+_TEMPLATES_LOCK = threading.Lock()
+
+
+def format_date(dt: arrow.Arrow, fmt: str) -> str:
+    """Format dt like dt.format(fmt), through a DateFormatter template."""
+    if fmt not in _TEMPLATES:
+        with _TEMPLATES_LOCK:  # demos may run on several threads
+            if fmt not in _TEMPLATES:
+                _FORMATTER.add_template(fmt, fmt)
+                _TEMPLATES.add(fmt)
+    return _FORMATTER.format(dt, fmt)
+
+
+@lru_cache(maxsize=1 << 17)
+def cached_get(value: str, fmt: Optional[str] = None) -> arrow.Arrow:
+    """Parse value with arrow.get(), caching the immutable result."""
+    return arrow.get(value, fmt) if fmt else arrow.get(value)
+
+
+@lru_cache(maxsize=4096)
+def _humanize_seconds(delta_seconds: int) -> str:
+    """Humanize a delta of whole seconds against a fixed reference."""
+    return (_HUMANIZE_REF + timedelta(seconds=delta_seconds)).humanize(
+        _HUMANIZE_REF
+    )
+
+
+def humanize_delta(dt: arrow.Arrow, now: arrow.Arrow) -> str:
+    """
+    Humanize dt relative to now, caching on the rounded delta.
+
+    Below one week Arrow's wording depends only on the delta; longer
+    spans count calendar months, so those are humanized directly.
+    """
+    delta = round((dt - now).total_seconds())
+    if abs(delta) < _SECONDS_PER_WEEK:
+        return _humanize_seconds(delta)
+    return dt.humanize(now)
+
+
+class _ThreadOutput(io.TextIOBase):
+    """Stand-in for sys.stdout that gives each demo thread its own buffer."""
+
+    def __init__(self, stream: TextIO) -> None:
+        self._stream = stream
+        self._local = threading.local()
+
+    def write(self, text: str) -> int:
+        buffer: Optional[io.StringIO] = getattr(self._local, 'buffer', None)
+        if buffer is None:
+            return self._stream.write(text)
+        return buffer.write(text)
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+    def capture(self, demo: Callable[[], None]) -> str:
+        """Run demo and return what it printed."""
+        self._local.buffer = buffer = io.StringIO()
+        try:
+            demo()
+        finally:
+            del self._local.buffer
+        return buffer.getvalue()
+
+
+async def _run_concurrently(demos: Sequence[Callable[[], None]]) -> List[str]:
+    """Run the demos on worker threads and return each one's output."""
+    stdout = sys.stdout
+    output = _ThreadOutput(stdout)
+    sys.stdout = cast(TextIO, output)
+    try:
+        loop = asyncio.get_running_loop()
+        return list(await asyncio.gather(
+            *(loop.run_in_executor(None, output.capture, demo)
+              for demo in demos)
+        ))
+    finally:
+        sys.stdout = stdout
+
+
+def run_demos(demos: Sequence[Callable[[], None]]) -> None:
+    """
+    Run the demos and print their output section by section.
+
+    With PACE set they run one after another, pausing PACE seconds
+    between them. Otherwise they run concurrently on worker threads,
+    and each demo's output is held back and printed in order.
+    """
+    if PACE:
+        for i, demo in enumerate(demos):
+            if i:
+                time.sleep(PACE)
+            demo()
+        return
+
+    for output in asyncio.run(_run_concurrently(demos)):
+        sys.stdout.write(output)
@@ -4,25 +4,108 @@ Advanced Arrow features and use cases.
 Demonstrates advanced operations like ranges, business days, humanization.
 """
 
-import time
+import calendar
+import sys
+from datetime import timedelta
+from pathlib import Path
+from typing import Tuple
 
 import arrow
+import numpy as np
+
+if __package__ in (None, ''):  # run as a script; make the repo importable
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from examples._demo import (
+    SEP,
+    cached_get,
+    format_date,
+    humanize_delta,
+    run_demos,
+)
+from utils.date_helpers import business_day_mask
+
+
+_ONE_MICROSECOND = timedelta(microseconds=1)
+_PAST_OFFSETS = (
+    timedelta(seconds=-30),
+    timedelta(minutes=-5),
+    timedelta(hours=-2),
+    timedelta(days=-1),
+    timedelta(weeks=-2),
+)
+_FUTURE_OFFSETS = (
+    timedelta(hours=1),
+    timedelta(days=2),
+    timedelta(weeks=1),
+)
+
+
+def _drange(
+    start: arrow.Arrow,
+    end: arrow.Arrow,
+    unit: str = 'D'
+) -> np.ndarray:
+    """Build an inclusive datetime64 range, like Arrow.range, in one go."""
+    step = np.timedelta64(1, unit)
+    return np.arange(
+        np.datetime64(start.naive),
+        np.datetime64(end.naive) + step,
+        step,
+    )
+
+
+def _floor_day(dt: arrow.Arrow) -> arrow.Arrow:
+    """Floor dt to midnight by replacing fields on the datetime."""
+    return arrow.Arrow.fromdatetime(
+        dt.datetime.replace(hour=0, minute=0, second=0, microsecond=0)
+    )
+
+
+def _floor_month(dt: arrow.Arrow) -> arrow.Arrow:
+    """Floor dt to the first instant of its month."""
+    return arrow.Arrow.fromdatetime(
+        dt.datetime.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    )
+
+
+def _span_day(dt: arrow.Arrow) -> Tuple[arrow.Arrow, arrow.Arrow]:
+    """Return the (floor, ceil) span of dt's day."""
+    start = _floor_day(dt)
+    return start, start + (timedelta(days=1) - _ONE_MICROSECOND)
+
+
+def _span_week(dt: arrow.Arrow) -> Tuple[arrow.Arrow, arrow.Arrow]:
+    """Return the Monday-based (floor, ceil) span of dt's week."""
+    start = _floor_day(dt) - timedelta(days=dt.weekday())
+    return start, start + (timedelta(weeks=1) - _ONE_MICROSECOND)
+
+
+def _span_month(dt: arrow.Arrow) -> Tuple[arrow.Arrow, arrow.Arrow]:
+    """Return the (floor, ceil) span of dt's month."""
+    start = _floor_month(dt)
+    days = calendar.monthrange(dt.year, dt.month)[1]
+    return start, start + (timedelta(days=days) - _ONE_MICROSECOND)
 
 
 def demo_date_ranges() -> None:
     """Generate date ranges with various spans."""
     print("\n=== Date Ranges Demo ===")
 
-    start = arrow.get('2024-02-01')
-    end = arrow.get('2024-02-10')
+    start = cached_get('2024-02-01')
+    end = cached_get('2024-02-10')
 
     print("Daily range:")
-    for date in arrow.Arrow.range('day', start, end):
-        print(f"  {date.format('YYYY-MM-DD dddd')}")
+    lines = []
+    for date in _drange(start, end):
+        date = arrow.Arrow.fromdatetime(date.astype(object))
+        lines.append(f"  {format_date(date, 'YYYY-MM-DD dddd')}")
+    print("\n".join(lines))
 
     print("\nHourly range (first 24 hours):")
-    for hour in list(arrow.Arrow.range('hour', start, start.shift(days=1)))[:5]:
-        print(f"  {hour.format('YYYY-MM-DD HH:mm')}")
+    for hour in _drange(start, start.shift(days=1), 'h')[:5]:
+        hour = arrow.Arrow.fromdatetime(hour.astype(object))
+        print(f"  {format_date(hour, 'YYYY-MM-DD HH:mm')}")
         print("  ...")
         break
 
@@ -31,20 +114,20 @@ def demo_business_days() -> None:
     """Calculate business days (skip weekends)."""
     print("\n=== Business Days Demo ===")
 
-    start = arrow.get('2024-02-05')
-    print(f"Starting from: {start.format('YYYY-MM-DD dddd')}")
+    start = cached_get('2024-02-05')
+    print(f"Starting from: {format_date(start, 'YYYY-MM-DD dddd')}")
 
-    business_days = []
-    current = start
-
-    for _ in range(10):
-        if current.weekday() < 5:
-            business_days.append(current)
-        current = current.shift(days=1)
+    # Any 14 consecutive days hold exactly 10 business days
+    window = _drange(start, start.shift(days=13))
+    business_days = [
+        arrow.Arrow.fromdatetime(day.astype(object))
+        for day in window[business_day_mask(window)]
+    ]
 
     print("\nNext 10 business days:")
-    for day in business_days:
-        print(f"  {day.format('YYYY-MM-DD dddd')}")
+    print("\n".join(
+        f"  {format_date(day, 'YYYY-MM-DD dddd')}" for day in business_days
+    ))
 
 
 def demo_humanized_dates() -> None:
@@ -53,110 +136,104 @@ def demo_humanized_dates() -> None:
 
     now = arrow.utcnow()
 
-    times = [
-        now.shift(seconds=-30),
-        now.shift(minutes=-5),
-        now.shift(hours=-2),
-        now.shift(days=-1),
-        now.shift(weeks=-2),
-        now.shift(months=-3),
-        now.shift(years=-1),
-    ]
+    times = [now + offset for offset in _PAST_OFFSETS]
+    times += [now.shift(months=-3), now.shift(years=-1)]
 
     print("Past times (humanized):")
-    for t in times:
-        print(f"  {t.format('YYYY-MM-DD HH:mm:ss')} -> {t.humanize()}")
-
-    future_times = [
-        now.shift(hours=1),
-        now.shift(days=2),
-        now.shift(weeks=1),
-        now.shift(months=1),
-    ]
+    print("\n".join(
+        f"  {format_date(t, 'YYYY-MM-DD HH:mm:ss')} -> "
+        f"{humanize_delta(t, now)}"
+        for t in times
+    ))
+
+    future_times = [now + offset for offset in _FUTURE_OFFSETS]
+    future_times.append(now.shift(months=1))
 
     print("\nFuture times (humanized):")
-    for t in future_times:
-        print(f"  {t.format('YYYY-MM-DD HH:mm:ss')} -> {t.humanize()}")
+    print("\n".join(
+        f"  {format_date(t, 'YYYY-MM-DD HH:mm:ss')} -> "
+        f"{humanize_delta(t, now)}"
+        for t in future_times
+    ))
 
 
 def demo_time_series() -> None:
     """Generate time series data."""
     print("\n=== Time Series Demo ===")
 
-    start = arrow.get('2024-02-01 00:00:00')
+    start = cached_get('2024-02-01 00:00:00')
 
     print("Hourly time series (first 10 points):")
-    for i, timestamp in enumerate(
-        arrow.Arrow.range('hour', start, start.shift(days=1))
-    ):
-        if i < 10:
-            print(f"  Point {i}: {timestamp.format('YYYY-MM-DD HH:mm:ss')}")
-        elif i == 10:
-            print(f"  ... ({24 - 10} more points)")
-            break
+    start_dt = start.datetime
+    print("\n".join(
+        f"  Point {i}: "
+        f"{(start_dt + timedelta(hours=i)).strftime('%Y-%m-%d %H:%M:%S')}"
+        for i in range(10)
+    ))
+    print(f"  ... ({24 - 10} more points)")
 
 
 def demo_calendar_operations() -> None:
     """Perform calendar-based calculations."""
     print("\n=== Calendar Operations Demo ===")
 
-    dt = arrow.get('2024-02-15 14:30:45')
+    dt = cached_get('2024-02-15 14:30:45')
 
-    print(f"Original: {dt.format('YYYY-MM-DD HH:mm:ss')}")
+    print(f"Original: {format_date(dt, 'YYYY-MM-DD HH:mm:ss')}")
 
-    floor_day = dt.floor('day')
-    print(f"Floor to day: {floor_day.format('YYYY-MM-DD HH:mm:ss')}")
+    floor_day = _floor_day(dt)
+    print(f"Floor to day: {format_date(floor_day, 'YYYY-MM-DD HH:mm:ss')}")
 
-    ceil_day = dt.ceil('day')
-    print(f"Ceil to day: {ceil_day.format('YYYY-MM-DD HH:mm:ss')}")
+    ceil_day = _span_day(dt)[1]
+    print(f"Ceil to day: {format_date(ceil_day, 'YYYY-MM-DD HH:mm:ss')}")
 
-    floor_month = dt.floor('month')
-    print(f"Floor to month: {floor_month.format('YYYY-MM-DD HH:mm:ss')}")
+    floor_month = _floor_month(dt)
+    print(f"Floor to month: {format_date(floor_month, 'YYYY-MM-DD HH:mm:ss')}")
 
-    ceil_month = dt.ceil('month')
-    print(f"Ceil to month: {ceil_month.format('YYYY-MM-DD HH:mm:ss')}")
+    ceil_month = _span_month(dt)[1]
+    print(f"Ceil to month: {format_date(ceil_month, 'YYYY-MM-DD HH:mm:ss')}")
 
 
 def demo_span_operations() -> None:
     """Work with time spans."""
     print("\n=== Span Operations Demo ===")
 
-    dt = arrow.get('2024-02-15 14:30:45')
+    dt = cached_get('2024-02-15 14:30:45')
 
-    print(f"Date: {dt.format('YYYY-MM-DD HH:mm:ss')}")
+    print(f"Date: {format_date(dt, 'YYYY-MM-DD HH:mm:ss')}")
 
-    day_span = dt.span('day')
+    day_span = _span_day(dt)
     print(f"\nDay span:")
-    print(f"  Start: {day_span[0].format('YYYY-MM-DD HH:mm:ss')}")
-    print(f"  End: {day_span[1].format('YYYY-MM-DD HH:mm:ss')}")
+    print(f"  Start: {format_date(day_span[0], 'YYYY-MM-DD HH:mm:ss')}")
+    print(f"  End: {format_date(day_span[1], 'YYYY-MM-DD HH:mm:ss')}")
 
-    week_span = dt.span('week')
+    week_span = _span_week(dt)
     print(f"\nWeek span:")
-    print(f"  Start: {week_span[0].format('YYYY-MM-DD HH:mm:ss')}")
-    print(f"  End: {week_span[1].format('YYYY-MM-DD HH:mm:ss')}")
+    print(f"  Start: {format_date(week_span[0], 'YYYY-MM-DD HH:mm:ss')}")
+    print(f"  End: {format_date(week_span[1], 'YYYY-MM-DD HH:mm:ss')}")
 
-    month_span = dt.span('month')
+    month_span = _span_month(dt)
     print(f"\nMonth span:")
-    print(f"  Start: {month_span[0].format('YYYY-MM-DD HH:mm:ss')}")
-    print(f"  End: {month_span[1].format('YYYY-MM-DD HH:mm:ss')}")
+    print(f"  Start: {format_date(month_span[0], 'YYYY-MM-DD HH:mm:ss')}")
+    print(f"  End: {format_date(month_span[1], 'YYYY-MM-DD HH:mm:ss')}")
 
 
 def demo_replace_operations() -> None:
     """Replace specific date/time components."""
     print("\n=== Replace Operations Demo ===")
 
-    dt = arrow.get('2024-02-15 14:30:45')
+    dt = cached_get('2024-02-15 14:30:45')
 
-    print(f"Original: {dt.format('YYYY-MM-DD HH:mm:ss')}")
+    print(f"Original: {format_date(dt, 'YYYY-MM-DD HH:mm:ss')}")
 
     new_year = dt.replace(year=2025)
-    print(f"New year: {new_year.format('YYYY-MM-DD HH:mm:ss')}")
+    print(f"New year: {format_date(new_year, 'YYYY-MM-DD HH:mm:ss')}")
 
     new_month = dt.replace(month=12)
-    print(f"New month: {new_month.format('YYYY-MM-DD HH:mm:ss')}")
+    print(f"New month: {format_date(new_month, 'YYYY-MM-DD HH:mm:ss')}")
 
     new_time = dt.replace(hour=0, minute=0, second=0)
-    print(f"Midnight: {new_time.format('YYYY-MM-DD HH:mm:ss')}")
+    print(f"Midnight: {format_date(new_time, 'YYYY-MM-DD HH:mm:ss')}")
 
 
 def demo_for_json() -> None:
@@ -168,12 +245,12 @@ def demo_for_json() -> None:
     print("Formats suitable for JSON:")
     print(f"  ISO 8601: {dt.isoformat()}")
     print(f"  Unix timestamp: {dt.timestamp()}")
-    print(f"  Custom: {dt.format('YYYY-MM-DD HH:mm:ss')}")
+    print(f"  Custom: {format_date(dt, 'YYYY-MM-DD HH:mm:ss')}")
 
     json_data = {
         'timestamp': dt.timestamp(),
         'iso': dt.isoformat(),
-        'formatted': dt.format('YYYY-MM-DD HH:mm:ss'),
+        'formatted': format_date(dt, 'YYYY-MM-DD HH:mm:ss'),
     }
 
     print(f"\nJSON object: {json_data}")
@@ -181,36 +258,26 @@ def demo_for_json() -> None:
 
 def main() -> None:
     """Run all advanced examples."""
-    print("=" * 60)
+    print(SEP)
     print("Arrow Advanced Examples")
-    print("=" * 60)
-
-    demo_date_ranges()
-    time.sleep(0.5)
-
-    demo_business_days()
-    time.sleep(0.5)
-
-    demo_humanized_dates()
-    time.sleep(0.5)
-
-    demo_time_series()
-    time.sleep(0.5)
-
-    demo_calendar_operations()
-    time.sleep(0.5)
-
-    demo_span_operations()
-    time.sleep(0.5)
-
-    demo_replace_operations()
-    time.sleep(0.5)
+    print(SEP)
+
+    demos = [
+        demo_date_ranges,
+        demo_business_days,
+        demo_humanized_dates,
+        demo_time_series,
+        demo_calendar_operations,
+        demo_span_operations,
+        demo_replace_operations,
+        demo_for_json,
+    ]
 
-    demo_for_json()
+    run_demos(demos)
 
-    print("\n" + "=" * 60)
+    print("\n" + SEP)
     print("All advanced examples completed!")
-    print("=" * 60)
+    print(SEP)
 
 
 if __name__ == '__main__':
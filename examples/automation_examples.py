@@ -4,13 +4,31 @@ Real-world automation examples using Arrow.
 Demonstrates practical use cases like file naming, backups, reminders.
 """
 
-import os
 import shutil
-import time
+import sys
+from datetime import timedelta
 from pathlib import Path
 
 import arrow
 
+if __package__ in (None, ''):  # run as a script; make the repo importable
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from examples._demo import SEP, humanize_delta, run_demos
+
+
+_REMINDER_OFFSETS = (
+    timedelta(hours=2),
+    timedelta(hours=5),
+    timedelta(days=3),
+)
+_LOG_AGES = (
+    timedelta(days=1),
+    timedelta(days=5),
+    timedelta(days=10),
+    timedelta(days=15),
+)
+
 
 def demo_timestamped_filenames() -> None:
     """Generate files with timestamp names."""
@@ -18,6 +36,8 @@ def demo_timestamped_filenames() -> None:
 
     print("Creating timestamped files:")
 
+    now = arrow.utcnow()
+
     formats = [
         ('YYYYMMDD_HHmmss', 'backup'),
         ('YYYY-MM-DD_HH-mm-ss', 'log'),
@@ -25,29 +45,30 @@ def demo_timestamped_filenames() -> None:
         ('YYYY_MM_DD_HHmmss', 'export'),
     ]
 
-    for fmt, prefix in formats:
-        timestamp = arrow.utcnow().format(fmt)
-        filename = f"{prefix}_{timestamp}.txt"
-        print(f"  {filename}")
+    print("\n".join(
+        f"  {prefix}_{now.format(fmt)}.txt" for fmt, prefix in formats
+    ))
 
 
 def demo_scheduled_backups() -> None:
     """Schedule and execute timed backups."""
     print("\n=== Scheduled Backups Demo ===")
 
-    backup_time = arrow.utcnow().replace(hour=2, minute=0, second=0)
+    now = arrow.utcnow()
+
+    backup_time = now.replace(hour=2, minute=0, second=0)
     print(f"Backup scheduled for: {backup_time.format('HH:mm:ss')} UTC")
 
-    if backup_time < arrow.utcnow():
+    if backup_time < now:
         backup_time = backup_time.shift(days=1)
 
-    time_until = backup_time - arrow.utcnow()
+    time_until = backup_time - now
     hours = time_until.total_seconds() / 3600
 
     print(f"Next backup in: {hours:.2f} hours")
     print(f"Next backup at: {backup_time.format('YYYY-MM-DD HH:mm:ss')}")
 
-    filename = f"backup_{arrow.utcnow().format('YYYYMMDD_HHmmss')}.tar.gz"
+    filename = f"backup_{now.format('YYYYMMDD_HHmmss')}.tar.gz"
     print(f"Backup filename: {filename}")
 
 
@@ -55,26 +76,18 @@ def demo_reminder_system() -> None:
     """Build a simple reminder/notification system."""
     print("\n=== Reminder System Demo ===")
 
-    reminders = [
-        {
-            'title': 'Team Meeting',
-            'time': arrow.utcnow().shift(hours=2),
-        },
-        {
-            'title': 'Code Review',
-            'time': arrow.utcnow().shift(hours=5),
-        },
-        {
-            'title': 'Project Deadline',
-            'time': arrow.utcnow().shift(days=3),
-        },
-    ]
+    now = arrow.utcnow()
+
+    titles = ['Team Meeting', 'Code Review', 'Project Deadline']
+    times = [now + offset for offset in _REMINDER_OFFSETS]
 
     print("Active reminders:")
-    for reminder in reminders:
-        time_str = reminder['time'].humanize()
-        formatted = reminder['time'].format('YYYY-MM-DD HH:mm')
-        print(f"  '{reminder['title']}' - {time_str} ({formatted})")
+    lines = []
+    for title, remind_at in zip(titles, times):
+        time_str = humanize_delta(remind_at, now)
+        formatted = remind_at.format('YYYY-MM-DD HH:mm')
+        lines.append(f"  '{title}' - {time_str} ({formatted})")
+    print("\n".join(lines))
 
 
 def demo_log_rotation() -> None:
@@ -88,54 +101,50 @@ def demo_log_rotation() -> None:
     print(f"  Directory: {log_dir}")
     print(f"  Retention: {retention_days} days")
 
-    cutoff_date = arrow.utcnow().shift(days=-retention_days)
+    now = arrow.utcnow()
+
+    cutoff_date = now - timedelta(days=retention_days)
     print(f"  Cutoff date: {cutoff_date.format('YYYY-MM-DD')}")
 
-    sample_logs = [
-        arrow.utcnow().shift(days=-1),
-        arrow.utcnow().shift(days=-5),
-        arrow.utcnow().shift(days=-10),
-        arrow.utcnow().shift(days=-15),
-    ]
+    sample_logs = [now - age for age in _LOG_AGES]
 
     print("\nLog files (simulated):")
+    lines = []
     for log_date in sample_logs:
         filename = f"app_{log_date.format('YYYYMMDD')}.log"
         status = "KEEP" if log_date > cutoff_date else "DELETE"
-        print(f"  {filename} - {status}")
+        lines.append(f"  {filename} - {status}")
+    print("\n".join(lines))
 
 
 def demo_deadline_tracker() -> None:
     """Track and alert on upcoming deadlines."""
     print("\n=== Deadline Tracker Demo ===")
 
+    now = arrow.utcnow()
+
+    tasks = ['Submit tax returns', 'Project presentation', 'Quarterly report']
     deadlines = [
-        {
-            'task': 'Submit tax returns',
-            'deadline': arrow.get('2024-04-15'),
-        },
-        {
-            'task': 'Project presentation',
-            'deadline': arrow.utcnow().shift(days=5),
-        },
-        {
-            'task': 'Quarterly report',
-            'deadline': arrow.utcnow().shift(days=15),
-        },
+        arrow.get('2024-04-15'),
+        now.shift(days=5),
+        now.shift(days=15),
     ]
 
-    now = arrow.utcnow()
+    today = now.date().toordinal()
 
     print("Deadline tracking:")
-    for item in deadlines:
-        deadline = item['deadline']
-        days_left = (deadline - now).days
+    lines = []
+    for task, deadline in zip(tasks, deadlines):
+        days_left = deadline.date().toordinal() - today
 
         status = "URGENT" if days_left <= 7 else "OK"
         formatted = deadline.format('YYYY-MM-DD')
 
-        print(f"  {item['task']}")
-        print(f"    Due: {formatted} ({days_left} days left) - {status}")
+        lines.append(f"  {task}")
+        lines.append(
+            f"    Due: {formatted} ({days_left} days left) - {status}"
+        )
+    print("\n".join(lines))
 
 
 def demo_periodic_tasks() -> None:
@@ -150,13 +159,15 @@ def demo_periodic_tasks() -> None:
     ]
 
     print("Scheduled tasks:")
+    lines = []
     for task in tasks:
         if task['interval'] == 'daily':
-            print(f"  {task['name']}: Every day at {task['time']}")
+            lines.append(f"  {task['name']}: Every day at {task['time']}")
         elif task['interval'] == 'weekly':
-            print(f"  {task['name']}: Every {task['day']}")
+            lines.append(f"  {task['name']}: Every {task['day']}")
         else:
-            print(f"  {task['name']}: {task['interval']}")
+            lines.append(f"  {task['name']}: {task['interval']}")
+    print("\n".join(lines))
 
 
 def demo_file_organization() -> None:
@@ -171,42 +182,33 @@ def demo_file_organization() -> None:
     ]
 
     print("Organizing files by year/month:")
-    for file_date in files:
-        path = f"{file_date.year}/{file_date.month:02d}"
-        filename = f"file_{file_date.format('YYYYMMDD')}.txt"
-        full_path = f"{path}/{filename}"
-        print(f"  {full_path}")
+    print("\n".join(
+        f"  {d.year}/{d.month:02d}/file_{d.datetime:%Y%m%d}.txt"
+        for d in files
+    ))
 
 
 def main() -> None:
     """Run all automation examples."""
-    print("=" * 60)
+    print(SEP)
     print("Arrow Automation Examples")
-    print("=" * 60)
-
-    demo_timestamped_filenames()
-    time.sleep(0.5)
-
-    demo_scheduled_backups()
-    time.sleep(0.5)
-
-    demo_reminder_system()
-    time.sleep(0.5)
-
-    demo_log_rotation()
-    time.sleep(0.5)
-
-    demo_deadline_tracker()
-    time.sleep(0.5)
-
-    demo_periodic_tasks()
-    time.sleep(0.5)
+    print(SEP)
+
+    demos = [
+        demo_timestamped_filenames,
+        demo_scheduled_backups,
+        demo_reminder_system,
+        demo_log_rotation,
+        demo_deadline_tracker,
+        demo_periodic_tasks,
+        demo_file_organization,
+    ]
 
-    demo_file_organization()
+    run_demos(demos)
 
-    print("\n" + "=" * 60)
+    print("\n" + SEP)
     print("All automation examples completed!")
-    print("=" * 60)
+    print(SEP)
 
 
 if __name__ == '__main__':
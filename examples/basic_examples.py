@@ -4,10 +4,16 @@ Basic Arrow examples demonstrating fundamental operations.
 Run this script to see Arrow basics in action.
 """
 
-import time
+import sys
+from pathlib import Path
 
 import arrow
 
+if __package__ in (None, ''):  # run as a script; make the repo importable
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from examples._demo import SEP, cached_get, format_date, run_demos
+
 
 def demo_current_time() -> None:
     """Get current time in various formats."""
@@ -19,7 +25,7 @@ def demo_current_time() -> None:
     local_now = arrow.now()
     print(f"Local Now: {local_now}")
 
-    formatted = utc_now.format('YYYY-MM-DD HH:mm:ss')
+    formatted = format_date(utc_now, 'YYYY-MM-DD HH:mm:ss')
     print(f"Formatted: {formatted}")
 
 
@@ -28,31 +34,33 @@ def demo_time_shifting() -> None:
     print("\n=== Time Shifting Demo ===")
 
     now = arrow.utcnow()
-    print(f"Now: {now.format('YYYY-MM-DD HH:mm:ss')}")
+    print(f"Now: {format_date(now, 'YYYY-MM-DD HH:mm:ss')}")
 
     future = now.shift(hours=5)
-    print(f"5 hours later: {future.format('YYYY-MM-DD HH:mm:ss')}")
+    print(f"5 hours later: {format_date(future, 'YYYY-MM-DD HH:mm:ss')}")
 
     past = now.shift(days=-3)
-    print(f"3 days ago: {past.format('YYYY-MM-DD HH:mm:ss')}")
+    print(f"3 days ago: {format_date(past, 'YYYY-MM-DD HH:mm:ss')}")
 
     next_week = now.shift(weeks=1)
-    print(f"Next week: {next_week.format('YYYY-MM-DD HH:mm:ss')}")
+    print(f"Next week: {format_date(next_week, 'YYYY-MM-DD HH:mm:ss')}")
 
     next_month = now.shift(months=1)
-    print(f"Next month: {next_month.format('YYYY-MM-DD HH:mm:ss')}")
+    print(f"Next month: {format_date(next_month, 'YYYY-MM-DD HH:mm:ss')}")
 
 
 def demo_time_ranges() -> None:
     """Create and iterate over time ranges."""
     print("\n=== Time Ranges Demo ===")
 
-    start = arrow.get('2024-02-01')
-    end = arrow.get('2024-02-05')
+    start = cached_get('2024-02-01')
+    end = cached_get('2024-02-05')
 
     print("Date range from Feb 1 to Feb 5, 2024:")
-    for date in arrow.Arrow.range('day', start, end):
-        print(f"  {date.format('YYYY-MM-DD')}")
+    print("\n".join(
+        f"  {format_date(date, 'YYYY-MM-DD')}"
+        for date in arrow.Arrow.range('day', start, end)
+    ))
 
 
 def demo_relative_time() -> None:
@@ -75,11 +83,11 @@ def demo_time_comparison() -> None:
     """Compare dates and times."""
     print("\n=== Time Comparison Demo ===")
 
-    date1 = arrow.get('2024-02-07')
-    date2 = arrow.get('2024-02-10')
+    date1 = cached_get('2024-02-07')
+    date2 = cached_get('2024-02-10')
 
-    print(f"Date 1: {date1.format('YYYY-MM-DD')}")
-    print(f"Date 2: {date2.format('YYYY-MM-DD')}")
+    print(f"Date 1: {format_date(date1, 'YYYY-MM-DD')}")
+    print(f"Date 2: {format_date(date2, 'YYYY-MM-DD')}")
     print(f"Date 1 < Date 2: {date1 < date2}")
     print(f"Date 1 == Date 2: {date1 == date2}")
 
@@ -91,7 +99,7 @@ def demo_time_properties() -> None:
     """Access date/time components."""
     print("\n=== Time Properties Demo ===")
 
-    dt = arrow.get('2024-02-07 14:30:45')
+    dt = cached_get('2024-02-07 14:30:45')
 
     print(f"Full datetime: {dt}")
     print(f"Year: {dt.year}")
@@ -100,36 +108,30 @@ def demo_time_properties() -> None:
     print(f"Hour: {dt.hour}")
     print(f"Minute: {dt.minute}")
     print(f"Second: {dt.second}")
-    print(f"Weekday: {dt.format('dddd')}")
+    print(f"Weekday: {format_date(dt, 'dddd')}")
     print(f"Week of year: {dt.week}")
 
 
 def main() -> None:
     """Run all basic examples."""
-    print("=" * 60)
+    print(SEP)
     print("Arrow Basic Examples")
-    print("=" * 60)
-
-    demo_current_time()
-    time.sleep(0.5)
-
-    demo_time_shifting()
-    time.sleep(0.5)
-
-    demo_time_ranges()
-    time.sleep(0.5)
-
-    demo_relative_time()
-    time.sleep(0.5)
+    print(SEP)
 
-    demo_time_comparison()
-    time.sleep(0.5)
+    demos = [
+        demo_current_time,
+        demo_time_shifting,
+        demo_time_ranges,
+        demo_relative_time,
+        demo_time_comparison,
+        demo_time_properties,
+    ]
 
-    demo_time_properties()
+    run_demos(demos)
 
-    print("\n" + "=" * 60)
+    print("\n" + SEP)
     print("All basic examples completed!")
-    print("=" * 60)
+    print(SEP)
 
 
 if __name__ == '__main__':
@@ -4,24 +4,30 @@ Date formatting and parsing examples with Arrow.
 Demonstrates various ways to format and parse dates.
 """
 
-import time
+import sys
+from pathlib import Path
 
 import arrow
 
+if __package__ in (None, ''):  # run as a script; make the repo importable
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from examples._demo import SEP, cached_get, format_date, run_demos
+
 
 def demo_format_conversions() -> None:
     """Convert between different date formats."""
     print("\n=== Format Conversions Demo ===")
 
-    dt = arrow.get('2024-02-07 14:30:45')
+    dt = cached_get('2024-02-07 14:30:45')
 
     print("Various date formats:")
-    print(f"  ISO 8601: {dt.format('YYYY-MM-DD')}")
-    print(f"  US Format: {dt.format('MM/DD/YYYY')}")
-    print(f"  EU Format: {dt.format('DD/MM/YYYY')}")
-    print(f"  Full: {dt.format('MMMM DD, YYYY')}")
-    print(f"  With Time: {dt.format('YYYY-MM-DD HH:mm:ss')}")
-    print(f"  12-hour: {dt.format('YYYY-MM-DD hh:mm:ss A')}")
+    print(f"  ISO 8601: {format_date(dt, 'YYYY-MM-DD')}")
+    print(f"  US Format: {format_date(dt, 'MM/DD/YYYY')}")
+    print(f"  EU Format: {format_date(dt, 'DD/MM/YYYY')}")
+    print(f"  Full: {format_date(dt, 'MMMM DD, YYYY')}")
+    print(f"  With Time: {format_date(dt, 'YYYY-MM-DD HH:mm:ss')}")
+    print(f"  12-hour: {format_date(dt, 'YYYY-MM-DD hh:mm:ss A')}")
 
 
 def demo_iso8601_formatting() -> None:
@@ -31,31 +37,31 @@ def demo_iso8601_formatting() -> None:
     dt = arrow.utcnow()
 
     print("ISO 8601 formats:")
-    print(f"  Basic: {dt.format('YYYY-MM-DD')}")
-    print(f"  With time: {dt.format('YYYY-MM-DDTHH:mm:ss')}")
+    print(f"  Basic: {format_date(dt, 'YYYY-MM-DD')}")
+    print(f"  With time: {format_date(dt, 'YYYY-MM-DDTHH:mm:ss')}")
     print(f"  Full: {dt.isoformat()}")
-    print(f"  Custom: {dt.format('YYYY-MM-DDTHH:mm:ssZZ')}")
+    print(f"  Custom: {format_date(dt, 'YYYY-MM-DDTHH:mm:ssZZ')}")
 
 
 def demo_custom_formats() -> None:
     """Create custom format strings."""
     print("\n=== Custom Formats Demo ===")
 
-    dt = arrow.get('2024-02-07 14:30:45')
+    dt = cached_get('2024-02-07 14:30:45')
 
     print("Custom formats:")
-    print(f"  Log format: {dt.format('YYYY-MM-DD HH:mm:ss')}")
-    print(f"  Filename: {dt.format('YYYYMMDD_HHmmss')}")
-    print(f"  Display: {dt.format('MMM DD, YYYY [at] h:mm A')}")
-    print(f"  Short: {dt.format('YY/MM/DD')}")
-    print(f"  Long: {dt.format('dddd, MMMM DD, YYYY')}")
+    print(f"  Log format: {format_date(dt, 'YYYY-MM-DD HH:mm:ss')}")
+    print(f"  Filename: {format_date(dt, 'YYYYMMDD_HHmmss')}")
+    print(f"  Display: {format_date(dt, 'MMM DD, YYYY [at] h:mm A')}")
+    print(f"  Short: {format_date(dt, 'YY/MM/DD')}")
+    print(f"  Long: {format_date(dt, 'dddd, MMMM DD, YYYY')}")
 
 
 def demo_locale_formatting() -> None:
     """Format dates in different locales."""
     print("\n=== Locale Formatting Demo ===")
 
-    dt = arrow.get('2024-02-07 14:30:45')
+    dt = cached_get('2024-02-07 14:30:45')
 
     try:
         print("Date in different locales:")
@@ -71,19 +77,19 @@ def demo_parsing_strings() -> None:
 
     print("Parsing different date formats:")
 
-    dt1 = arrow.get('2024-02-07', 'YYYY-MM-DD')
+    dt1 = cached_get('2024-02-07', 'YYYY-MM-DD')
     print(f"  ISO: '2024-02-07' -> {dt1}")
 
-    dt2 = arrow.get('02/07/2024', 'MM/DD/YYYY')
+    dt2 = cached_get('02/07/2024', 'MM/DD/YYYY')
     print(f"  US: '02/07/2024' -> {dt2}")
 
-    dt3 = arrow.get('07-02-2024', 'DD-MM-YYYY')
+    dt3 = cached_get('07-02-2024', 'DD-MM-YYYY')
     print(f"  EU: '07-02-2024' -> {dt3}")
 
-    dt4 = arrow.get('2024-02-07 14:30:45', 'YYYY-MM-DD HH:mm:ss')
+    dt4 = cached_get('2024-02-07 14:30:45', 'YYYY-MM-DD HH:mm:ss')
     print(f"  Datetime: '2024-02-07 14:30:45' -> {dt4}")
 
-    dt5 = arrow.get('20240207_143045', 'YYYYMMDD_HHmmss')
+    dt5 = cached_get('20240207_143045', 'YYYYMMDD_HHmmss')
     print(f"  Filename: '20240207_143045' -> {dt5}")
 
 
@@ -91,7 +97,7 @@ def demo_timestamp_conversion() -> None:
     """Convert to/from Unix timestamps."""
     print("\n=== Timestamp Conversion Demo ===")
 
-    dt = arrow.get('2024-02-07 14:30:45')
+    dt = cached_get('2024-02-07 14:30:45')
 
     timestamp = dt.timestamp()
     print(f"Datetime: {dt}")
@@ -107,45 +113,39 @@ def demo_natural_dates() -> None:
     """Parse natural language dates."""
     print("\n=== Natural Date Parsing Demo ===")
 
+    today = arrow.now()
+
     print("Common date shortcuts:")
-    print(f"  Today: {arrow.now().format('YYYY-MM-DD')}")
-    print(f"  Yesterday: {arrow.now().shift(days=-1).format('YYYY-MM-DD')}")
-    print(f"  Tomorrow: {arrow.now().shift(days=1).format('YYYY-MM-DD')}")
+    print(f"  Today: {format_date(today, 'YYYY-MM-DD')}")
+    print(f"  Yesterday: {format_date(today.shift(days=-1), 'YYYY-MM-DD')}")
+    print(f"  Tomorrow: {format_date(today.shift(days=1), 'YYYY-MM-DD')}")
 
     print("\nRelative dates:")
-    print(f"  Last week: {arrow.now().shift(weeks=-1).format('YYYY-MM-DD')}")
-    print(f"  Next month: {arrow.now().shift(months=1).format('YYYY-MM-DD')}")
+    print(f"  Last week: {format_date(today.shift(weeks=-1), 'YYYY-MM-DD')}")
+    print(f"  Next month: {format_date(today.shift(months=1), 'YYYY-MM-DD')}")
 
 
 def main() -> None:
     """Run all formatting and parsing examples."""
-    print("=" * 60)
+    print(SEP)
     print("Arrow Formatting & Parsing Examples")
-    print("=" * 60)
-
-    demo_format_conversions()
-    time.sleep(0.5)
-
-    demo_iso8601_formatting()
-    time.sleep(0.5)
-
-    demo_custom_formats()
-    time.sleep(0.5)
-
-    demo_locale_formatting()
-    time.sleep(0.5)
-
-    demo_parsing_strings()
-    time.sleep(0.5)
+    print(SEP)
 
-    demo_timestamp_conversion()
-    time.sleep(0.5)
+    demos = [
+        demo_format_conversions,
+        demo_iso8601_formatting,
+        demo_custom_formats,
+        demo_locale_formatting,
+        demo_parsing_strings,
+        demo_timestamp_conversion,
+        demo_natural_dates,
+    ]
 
-    demo_natural_dates()
+    run_demos(demos)
 
-    print("\n" + "=" * 60)
+    print("\n" + SEP)
     print("All formatting & parsing examples completed!")
-    print("=" * 60)
+    print(SEP)
 
 
 if __name__ == '__main__':
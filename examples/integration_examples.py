@@ -5,10 +5,45 @@ Demonstrates Arrow usage with pandas, JSON, databases, APIs.
 """
 
 import json
+import sys
 import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict
 
 import arrow
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the json module
+    orjson = None
+
+if __package__ in (None, ''):  # run as a script; make the repo importable
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from examples._demo import SEP, run_demos
+
+
+def _json_default(value: Any) -> str:
+    """Serialize datetimes for the stdlib json fallback."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Not JSON serializable: {type(value).__name__}")
+
+
+def _dumps(data: Dict[str, Any]) -> str:
+    """Serialize data as indented JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2, default=_json_default)
+
+
+def _loads(text: str) -> Any:
+    """Parse JSON text, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
 
 def demo_pandas_integration() -> None:
     """Use Arrow with pandas DataFrames."""
@@ -49,15 +84,15 @@ def demo_json_serialization() -> None:
     data = {
         'event': 'User Login',
         'timestamp': dt.timestamp(),
-        'iso_date': dt.isoformat(),
+        'iso_date': dt.datetime,
         'formatted': dt.format('YYYY-MM-DD HH:mm:ss'),
     }
 
-    json_str = json.dumps(data, indent=2)
+    json_str = _dumps(data)
     print("Serialized JSON:")
     print(json_str)
 
-    loaded_data = json.loads(json_str)
+    loaded_data = _loads(json_str)
 
     print("\nDeserialized dates:")
     dt_from_ts = arrow.get(loaded_data['timestamp'])
@@ -96,35 +131,25 @@ def demo_api_date_parsing() -> None:
     """Parse dates from API responses."""
     print("\n=== API Date Parsing Demo ===")
 
-    api_responses = [
-        {
-            'format': 'ISO 8601',
-            'date': '2024-02-07T14:30:45Z',
-        },
-        {
-            'format': 'Unix timestamp',
-            'date': 1707318645,
-        },
-        {
-            'format': 'Custom format',
-            'date': '2024-02-07 14:30:45',
-        },
-    ]
+    formats = ['ISO 8601', 'Unix timestamp', 'Custom format']
+    raw_dates = ['2024-02-07T14:30:45Z', 1707318645, '2024-02-07 14:30:45']
 
     print("Parsing various API date formats:")
-    for response in api_responses:
-        print(f"\n{response['format']}:")
-        print(f"  Raw: {response['date']}")
-
-        if isinstance(response['date'], int):
-            dt = arrow.get(response['date'])
-        elif 'T' in str(response['date']):
-            dt = arrow.get(response['date'])
+    lines = []
+    for format_name, raw in zip(formats, raw_dates):
+        lines.append(f"\n{format_name}:")
+        lines.append(f"  Raw: {raw}")
+
+        if isinstance(raw, int):
+            dt = arrow.get(raw)
+        elif 'T' in str(raw):
+            dt = arrow.get(raw)
         else:
-            dt = arrow.get(response['date'], 'YYYY-MM-DD HH:mm:ss')
+            dt = arrow.get(raw, 'YYYY-MM-DD HH:mm:ss')
 
-        print(f"  Parsed: {dt}")
-        print(f"  Formatted: {dt.format('MMMM DD, YYYY at HH:mm')}")
+        lines.append(f"  Parsed: {dt}")
+        lines.append(f"  Formatted: {dt.format('MMMM DD, YYYY at HH:mm')}")
+    print("\n".join(lines))
 
 
 def demo_config_date_handling() -> None:
@@ -139,13 +164,14 @@ def demo_config_date_handling() -> None:
     }
 
     print("Configuration:")
-    print(json.dumps(config, indent=2))
+    print(_dumps(config))
 
     print("\nProcessed configuration:")
 
+    hour, minute = map(int, config['backup_time'].split(':'))
     backup_time = arrow.now(config['timezone']).replace(
-        hour=int(config['backup_time'].split(':')[0]),
-        minute=int(config['backup_time'].split(':')[1]),
+        hour=hour,
+        minute=minute,
         second=0
     )
     print(f"Backup time: {backup_time.format('YYYY-MM-DD HH:mm:ss ZZ')}")
@@ -168,60 +194,57 @@ def demo_csv_date_handling() -> None:
     ]
 
     print("CSV data with dates:")
+    lines = []
     for row in csv_data:
         date_obj = arrow.get(row['date'])
         row['parsed_date'] = date_obj
         row['weekday'] = date_obj.format('dddd')
-        print(f"  {row['date']} ({row['weekday']}): {row['value']}")
+        lines.append(f"  {row['date']} ({row['weekday']}): {row['value']}")
+    print("\n".join(lines))
 
 
 def demo_logging_timestamps() -> None:
     """Generate timestamps for logging."""
     print("\n=== Logging Timestamps Demo ===")
 
-    log_entries = [
-        {'level': 'INFO', 'message': 'Application started'},
-        {'level': 'DEBUG', 'message': 'Processing request'},
-        {'level': 'WARNING', 'message': 'High memory usage'},
-        {'level': 'ERROR', 'message': 'Connection failed'},
+    levels = ['INFO', 'DEBUG', 'WARNING', 'ERROR']
+    messages = [
+        'Application started',
+        'Processing request',
+        'High memory usage',
+        'Connection failed',
     ]
 
+    log_format = '%Y-%m-%d %H:%M:%S'
+
     print("Log entries with timestamps:")
-    for entry in log_entries:
-        timestamp = arrow.utcnow().format('YYYY-MM-DD HH:mm:ss')
-        print(f"{timestamp} - {entry['level']:7} - {entry['message']}")
+    for level, message in zip(levels, messages):
+        timestamp = arrow.utcnow().datetime.strftime(log_format)
+        print(f"{timestamp} - {level:7} - {message}")
         time.sleep(0.1)
 
 
 def main() -> None:
     """Run all integration examples."""
-    print("=" * 60)
+    print(SEP)
     print("Arrow Integration Examples")
-    print("=" * 60)
-
-    demo_pandas_integration()
-    time.sleep(0.5)
-
-    demo_json_serialization()
-    time.sleep(0.5)
-
-    demo_database_timestamps()
-    time.sleep(0.5)
-
-    demo_api_date_parsing()
-    time.sleep(0.5)
-
-    demo_config_date_handling()
-    time.sleep(0.5)
-
-    demo_csv_date_handling()
-    time.sleep(0.5)
+    print(SEP)
+
+    demos = [
+        demo_pandas_integration,
+        demo_json_serialization,
+        demo_database_timestamps,
+        demo_api_date_parsing,
+        demo_config_date_handling,
+        demo_csv_date_handling,
+        demo_logging_timestamps,
+    ]
 
-    demo_logging_timestamps()
+    run_demos(demos)
 
-    print("\n" + "=" * 60)
+    print("\n" + SEP)
     print("All integration examples completed!")
-    print("=" * 60)
+    print(SEP)
 
 
 if __name__ == '__main__':
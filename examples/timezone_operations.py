@@ -4,10 +4,43 @@ Timezone operations and conversions with Arrow.
 Demonstrates timezone handling, conversions, and world clock.
 """
 
-import time
+import sys
+from pathlib import Path
 
 import arrow
 
+if __package__ in (None, ''):  # run as a script; make the repo importable
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from examples._demo import SEP, run_demos
+from utils.timezone_helpers import get_zone
+
+
+_ZONES = {
+    name: get_zone(name)
+    for name in (
+        'America/New_York',
+        'Europe/London',
+        'Asia/Tokyo',
+        'Australia/Sydney',
+    )
+}
+_WORLD_CLOCK = tuple(
+    (city, get_zone(tz))
+    for city, tz in (
+        ('UTC', 'UTC'),
+        ('New York', 'America/New_York'),
+        ('Los Angeles', 'America/Los_Angeles'),
+        ('London', 'Europe/London'),
+        ('Paris', 'Europe/Paris'),
+        ('Dubai', 'Asia/Dubai'),
+        ('Mumbai', 'Asia/Kolkata'),
+        ('Singapore', 'Asia/Singapore'),
+        ('Tokyo', 'Asia/Tokyo'),
+        ('Sydney', 'Australia/Sydney'),
+    )
+)
+
 
 def demo_utc_local_conversion() -> None:
     """Convert between UTC and local time."""
@@ -30,30 +63,27 @@ def demo_timezone_conversion() -> None:
     utc = arrow.utcnow()
     print(f"UTC: {utc.format('YYYY-MM-DD HH:mm:ss')}")
 
-    ny = utc.to('America/New_York')
-    print(f"New York: {ny.format('YYYY-MM-DD HH:mm:ss ZZ')}")
-
-    london = utc.to('Europe/London')
-    print(f"London: {london.format('YYYY-MM-DD HH:mm:ss ZZ')}")
-
-    tokyo = utc.to('Asia/Tokyo')
-    print(f"Tokyo: {tokyo.format('YYYY-MM-DD HH:mm:ss ZZ')}")
-
-    sydney = utc.to('Australia/Sydney')
-    print(f"Sydney: {sydney.format('YYYY-MM-DD HH:mm:ss ZZ')}")
+    for city, tz_name in (
+        ('New York', 'America/New_York'),
+        ('London', 'Europe/London'),
+        ('Tokyo', 'Asia/Tokyo'),
+        ('Sydney', 'Australia/Sydney'),
+    ):
+        local = utc.to(_ZONES[tz_name])
+        print(f"{city}: {local.format('YYYY-MM-DD HH:mm:ss ZZ')}")
 
 
 def demo_timezone_aware_operations() -> None:
     """Perform calculations across timezones."""
     print("\n=== Timezone-Aware Operations Demo ===")
 
-    ny_time = arrow.now('America/New_York')
+    ny_time = arrow.now(_ZONES['America/New_York'])
     print(f"New York: {ny_time.format('YYYY-MM-DD HH:mm:ss ZZ')}")
 
     shifted = ny_time.shift(hours=3)
     print(f"3 hours later: {shifted.format('YYYY-MM-DD HH:mm:ss ZZ')}")
 
-    tokyo_same_moment = ny_time.to('Asia/Tokyo')
+    tokyo_same_moment = ny_time.to(_ZONES['Asia/Tokyo'])
     print(f"Same moment in Tokyo: "
           f"{tokyo_same_moment.format('YYYY-MM-DD HH:mm:ss ZZ')}")
 
@@ -65,24 +95,11 @@ def demo_world_clock() -> None:
     utc = arrow.utcnow()
     print(f"Current time: {utc.format('YYYY-MM-DD HH:mm:ss')} UTC\n")
 
-    timezones = [
-        ('UTC', 'UTC'),
-        ('New York', 'America/New_York'),
-        ('Los Angeles', 'America/Los_Angeles'),
-        ('London', 'Europe/London'),
-        ('Paris', 'Europe/Paris'),
-        ('Dubai', 'Asia/Dubai'),
-        ('Mumbai', 'Asia/Kolkata'),
-        ('Singapore', 'Asia/Singapore'),
-        ('Tokyo', 'Asia/Tokyo'),
-        ('Sydney', 'Australia/Sydney'),
-    ]
-
     print("World Clock:")
-    for city, tz in timezones:
-        local_time = utc.to(tz)
-        print(f"  {city:15} {local_time.format('HH:mm:ss')} "
-              f"({local_time.format('ZZ')})")
+    print("\n".join(
+        f"  {city:15} {utc.to(zone).format('HH:mm:ss (ZZ)')}"
+        for city, zone in _WORLD_CLOCK
+    ))
 
 
 def demo_dst_handling() -> None:
@@ -109,41 +126,37 @@ def demo_timezone_info() -> None:
         'Asia/Tokyo',
     ]
 
+    lines = []
     for tz_name in timezones:
-        dt = arrow.now(tz_name)
-        print(f"\n{tz_name}:")
-        print(f"  Current time: {dt.format('YYYY-MM-DD HH:mm:ss')}")
-        print(f"  UTC offset: {dt.format('ZZ')}")
-        print(f"  Timezone abbr: {dt.tzinfo.tzname(None)}")
-        print(f"  DST active: {dt.dst().total_seconds() != 0}")
+        dt = arrow.now(_ZONES[tz_name])
+        lines.append(f"\n{tz_name}:")
+        lines.append(f"  Current time: {dt.format('YYYY-MM-DD HH:mm:ss')}")
+        lines.append(f"  UTC offset: {dt.format('ZZ')}")
+        lines.append(f"  Timezone abbr: {dt.tzname()}")
+        lines.append(f"  DST active: {dt.dst().total_seconds() != 0}")
+    print("\n".join(lines))
 
 
 def main() -> None:
     """Run all timezone examples."""
-    print("=" * 60)
+    print(SEP)
     print("Arrow Timezone Operations Examples")
-    print("=" * 60)
-
-    demo_utc_local_conversion()
-    time.sleep(0.5)
-
-    demo_timezone_conversion()
-    time.sleep(0.5)
-
-    demo_timezone_aware_operations()
-    time.sleep(0.5)
-
-    demo_world_clock()
-    time.sleep(0.5)
-
-    demo_dst_handling()
-    time.sleep(0.5)
+    print(SEP)
+
+    demos = [
+        demo_utc_local_conversion,
+        demo_timezone_conversion,
+        demo_timezone_aware_operations,
+        demo_world_clock,
+        demo_dst_handling,
+        demo_timezone_info,
+    ]
 
-    demo_timezone_info()
+    run_demos(demos)
 
-    print("\n" + "=" * 60)
+    print("\n" + SEP)
     print("All timezone examples completed!")
-    print("=" * 60)
+    print(SEP)
 
 
 if __name__ == '__main__':
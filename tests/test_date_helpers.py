@@ -2,13 +2,20 @@
 Tests for date helper functions.
 """
 
+import datetime
+
+import numpy as np
 import pytest
 from freezegun import freeze_time
 
 import arrow
 from utils.date_helpers import (
     age_from_birthdate,
+    age_from_date,
+    business_day_mask,
+    business_days_between,
     days_until,
+    days_until_date,
     get_date_range,
     get_month_dates,
     get_quarter_dates,
@@ -42,6 +49,51 @@ class TestGetDateRange:
 
         assert len(dates) == 3
 
+    def test_month_end_clamps_without_drift(self):
+        start = arrow.get('2024-01-31')
+        end = arrow.get('2024-04-30')
+        dates = get_date_range(start, end, 'month')
+
+        assert [d.format('YYYY-MM-DD') for d in dates] == [
+            '2024-01-31', '2024-02-29', '2024-03-31', '2024-04-30',
+        ]
+
+    def test_preserves_time_and_timezone(self):
+        start = arrow.get('2024-03-09 12:00:00', tzinfo='America/New_York')
+        end = start.shift(days=2)
+        dates = get_date_range(start, end, 'day')
+
+        assert [d.hour for d in dates] == [12, 12, 12]
+        assert dates[-1].tzinfo == start.tzinfo
+
+    def test_skips_dst_gap_like_arrow(self):
+        start = arrow.get('2024-03-09 02:30:00', tzinfo='America/New_York')
+        end = start.shift(days=3)
+        dates = get_date_range(start, end, 'day')
+
+        assert [d.isoformat() for d in dates] == [
+            r.isoformat() for r in arrow.Arrow.range('day', start, end)
+        ]
+        assert dates[1].isoformat() == '2024-03-10T03:30:00-04:00'
+
+    def test_start_in_dst_gap_is_kept_like_arrow(self):
+        start = arrow.get('2034-03-26 02:15:00', tzinfo='Europe/Brussels')
+        end = start.shift(months=2)
+        dates = get_date_range(start, end, 'month')
+
+        assert [d.isoformat() for d in dates] == [
+            r.isoformat() for r in arrow.Arrow.range('month', start, end)
+        ]
+
+    def test_as_ndarray(self):
+        start = arrow.get('2024-02-01')
+        end = arrow.get('2024-02-05')
+        dates = get_date_range(start, end, 'day', as_arrow=False)
+
+        assert isinstance(dates, np.ndarray)
+        assert len(dates) == 5
+        assert str(dates[-1].astype('datetime64[D]')) == '2024-02-05'
+
     def test_invalid_step(self):
         start = arrow.get('2024-02-01')
         end = arrow.get('2024-02-05')
@@ -75,6 +127,63 @@ class TestBusinessDay:
 
         assert next_day.format('YYYY-MM-DD') == '2024-02-06'
 
+    def test_next_business_day_from_weekend(self):
+        saturday = arrow.get('2024-02-10')
+        sunday = arrow.get('2024-02-11')
+
+        assert next_business_day(saturday).format('YYYY-MM-DD') == '2024-02-12'
+        assert next_business_day(sunday).format('YYYY-MM-DD') == '2024-02-12'
+
+    def test_is_business_day_array(self):
+        start = arrow.get('2024-02-09')
+        end = arrow.get('2024-02-12')
+        dates = get_date_range(start, end, 'day', as_arrow=False)
+
+        assert is_business_day(dates).tolist() == [True, False, False, True]
+
+    def test_business_days_between_full_week(self):
+        start = arrow.get('2024-02-05')
+        end = arrow.get('2024-02-11')
+
+        assert business_days_between(start, end) == 5
+
+    def test_business_days_between_matches_filter(self):
+        start = arrow.get('2024-01-01')
+        end = arrow.get('2024-03-31')
+        expected = sum(
+            is_business_day(day)
+            for day in get_date_range(start, end, 'day')
+        )
+
+        assert business_days_between(start, end) == expected
+
+    def test_business_days_between_partial_weeks(self):
+        start = arrow.get('2024-02-01')
+
+        for offset in range(30):
+            end = start.shift(days=offset)
+            expected = sum(
+                is_business_day(day)
+                for day in get_date_range(start, end, 'day')
+            )
+
+            assert business_days_between(start, end) == expected
+
+    def test_business_days_between_reversed(self):
+        start = arrow.get('2024-02-12')
+        end = arrow.get('2024-02-05')
+
+        assert business_days_between(start, end) == 0
+
+    def test_business_day_mask(self):
+        start = arrow.get('2024-02-09')
+        end = arrow.get('2024-02-12')
+        dates = get_date_range(start, end, 'day', as_arrow=False)
+
+        mask = business_day_mask(dates)
+
+        assert mask.tolist() == [True, False, False, True]
+
 
 class TestQuarterDates:
     def test_first_quarter(self):
@@ -93,6 +202,10 @@ class TestQuarterDates:
         with pytest.raises(ValueError, match="Quarter must be"):
             get_quarter_dates(2024, 5)
 
+    def test_fractional_quarter(self):
+        with pytest.raises(ValueError, match="Quarter must be"):
+            get_quarter_dates(2024, 2.5)
+
 
 class TestMonthDates:
     def test_january(self):
@@ -113,6 +226,15 @@ class TestMonthDates:
 
         assert end.day == 28
 
+    def test_february_century_years(self):
+        assert get_month_dates(1900, 2)[1].day == 28
+        assert get_month_dates(2000, 2)[1].day == 29
+
+    def test_end_is_last_microsecond(self):
+        _, end = get_month_dates(2024, 4)
+
+        assert end == arrow.get('2024-04-01').ceil('month')
+
 
 @freeze_time("2024-02-07")
 class TestDaysUntil:
@@ -134,6 +256,25 @@ class TestDaysUntil:
 
         assert days == 0
 
+    def test_explicit_now(self):
+        target = arrow.get('2024-03-01')
+        now = arrow.get('2024-02-25 23:59:59')
+
+        assert days_until(target, now=now) == 5
+
+    def test_array_targets(self):
+        targets = np.array(['2024-02-05', '2024-02-07', '2024-02-12'],
+                           dtype='datetime64[D]')
+
+        assert days_until(targets).tolist() == [-2, 0, 5]
+
+    def test_plain_date_and_ordinal(self):
+        target = datetime.date(2024, 2, 12)
+
+        assert days_until_date(target) == 5
+        assert days_until_date(target.toordinal()) == 5
+        assert days_until_date(target, today=datetime.date(2024, 2, 1)) == 11
+
 
 @freeze_time("2024-02-07")
 class TestAgeFromBirthdate:
@@ -160,3 +301,24 @@ class TestAgeFromBirthdate:
 
         with pytest.raises(ValueError, match="cannot be in the future"):
             age_from_birthdate(future)
+
+    def test_explicit_now(self):
+        birthdate = arrow.get('1990-03-01')
+        now = arrow.get('2024-03-01')
+
+        assert age_from_birthdate(birthdate, now=now) == 34
+
+    def test_array_birthdates(self):
+        birthdates = np.array(['1990-01-01', '1990-03-01', '1990-02-07'],
+                              dtype='datetime64[D]')
+
+        assert age_from_birthdate(birthdates).tolist() == [34, 33, 34]
+
+    def test_plain_date(self):
+        assert age_from_date(datetime.date(1990, 3, 1)) == 33
+        assert age_from_date(
+            datetime.date(1990, 3, 1), today=datetime.date(2024, 3, 1)
+        ) == 34
+
+        with pytest.raises(ValueError, match="cannot be in the future"):
+            age_from_date(datetime.date(2024, 2, 8))
@@ -106,6 +106,13 @@ class TestDateFormatter:
 
         assert result == '20240207_143045'
 
+    def test_fixed_templates_match_arrow_format(self):
+        formatter = DateFormatter()
+        dt = arrow.Arrow(999, 1, 2, 3, 4, 5)
+
+        for name, format_string in formatter.templates.items():
+            assert formatter.format(dt, name) == dt.format(format_string)
+
     def test_invalid_template_raises_error(self):
         formatter = DateFormatter()
         dt = arrow.get('2024-02-07 14:30:45')
@@ -122,6 +129,27 @@ class TestDateFormatter:
 
         assert result == '2024/02/07'
 
+    def test_templates_is_a_copy(self):
+        formatter = DateFormatter()
+        formatter.templates['short'] = 'DD/MM/YYYY'
+
+        dt = arrow.get('2024-02-07')
+
+        assert formatter.templates['short'] == 'YYYY-MM-DD'
+        assert formatter.format(dt, 'short') == '2024-02-07'
+
+    def test_default_is_shared(self):
+        assert DateFormatter.default() is DateFormatter.default()
+        assert isinstance(DateFormatter.default(), DateFormatter)
+
+    def test_default_rejects_new_templates(self):
+        dt = arrow.get('2024-02-07 14:30:45')
+
+        with pytest.raises(TypeError):
+            DateFormatter.default().add_template('log', 'YYYY')
+
+        assert format_for_log(dt) == '2024-02-07 14:30:45'
+
     def test_list_templates(self):
         formatter = DateFormatter()
         templates = formatter.list_templates()
@@ -129,3 +157,21 @@ class TestDateFormatter:
         assert isinstance(templates, list)
         assert 'short' in templates
         assert 'long' in templates
+
+    def test_compiled_template_matches_arrow_format(self):
+        formatter = DateFormatter()
+        formatter.add_template('custom', 'Do MMM YYYY [week] W, ZZ')
+        dt = arrow.get('2024-02-07 14:30:45', tzinfo='Asia/Kolkata')
+
+        assert formatter.format(dt, 'custom') == dt.format(
+            'Do MMM YYYY [week] W, ZZ'
+        )
+
+    def test_add_template_overrides_builtin(self):
+        formatter = DateFormatter()
+        formatter.add_template('short', 'DD/MM/YYYY')
+
+        dt = arrow.get('2024-02-07')
+        result = formatter.format(dt, 'short')
+
+        assert result == '07/02/2024'
@@ -32,6 +32,24 @@ class TestScheduleDaily:
         next_run = arrow.get(result['next_run'])
         assert next_run.day == 8
 
+    def test_explicit_now(self):
+        def task():
+            pass
+
+        now = arrow.get('2024-02-07 16:00:00')
+        result = schedule_daily(14, 30, task, 'UTC', now=now)
+
+        assert result['next_run'] == '2024-02-08T14:30:00+00:00'
+
+    def test_next_run_drops_subseconds(self):
+        def task():
+            pass
+
+        now = arrow.get('2024-02-07 12:00:00.250000')
+        result = schedule_daily(14, 30, task, 'UTC', now=now)
+
+        assert result['next_run'] == '2024-02-07T14:30:00+00:00'
+
 
 class TestReminder:
     def test_initialization(self):
@@ -48,6 +66,27 @@ class TestReminder:
         assert len(reminder.reminders) == 1
         assert reminder.reminders[0]['title'] == "Meeting"
 
+    def test_reminder_record_reads_like_dict(self):
+        reminder = Reminder()
+        remind_at = arrow.get('2024-02-07 14:00:00')
+        created_at = arrow.get('2024-02-07 12:00:00')
+
+        reminder.add("Meeting", remind_at, now=created_at)
+        record = reminder.reminders[0]
+
+        assert record.title == record['title'] == "Meeting"
+        assert dict(record) == {
+            'title': "Meeting",
+            'remind_at': remind_at,
+            'recurring': False,
+            'interval': None,
+            'created_at': created_at,
+            'active': True,
+        }
+
+        with pytest.raises(KeyError):
+            record['unknown'] = 1
+
     def test_list_active(self):
         reminder = Reminder()
         future = arrow.utcnow().shift(hours=2)
@@ -57,6 +96,22 @@ class TestReminder:
         active = reminder.list_active()
         assert len(active) == 1
 
+    def test_list_active_after_reactivation(self):
+        reminder = Reminder()
+        future = arrow.utcnow().shift(hours=2)
+
+        reminder.add("a", future)
+        reminder.add("b", future)
+        reminder.cancel("b")
+
+        assert [r['title'] for r in reminder.list_active()] == ['a']
+
+        reminder.cancel("a")
+        reminder.reactivate(reminder.reminders[1])
+        reminder.reactivate(reminder.reminders[0])
+
+        assert [r['title'] for r in reminder.list_active()] == ['a', 'b']
+
     @freeze_time("2024-02-07 12:00:00")
     def test_check_due_no_reminders(self):
         reminder = Reminder()
@@ -77,6 +132,15 @@ class TestReminder:
         assert len(due) == 1
         assert due[0]['title'] == "Past Meeting"
 
+    def test_check_due_explicit_now(self):
+        reminder = Reminder()
+        remind_at = arrow.get('2024-02-07 11:00:00')
+
+        reminder.add("Meeting", remind_at)
+
+        assert reminder.check_due(now=remind_at.shift(minutes=-1)) == []
+        assert len(reminder.check_due(now=remind_at)) == 1
+
     @freeze_time("2024-02-07 12:00:00")
     def test_check_due_non_recurring_deactivates(self):
         reminder = Reminder()
@@ -99,6 +163,83 @@ class TestReminder:
         assert reminder.reminders[0]['active'] is True
         assert reminder.reminders[0]['remind_at'].day == 8
 
+    @freeze_time("2024-02-07 12:00:00")
+    def test_check_due_overdue_recurring_fires_once(self):
+        reminder = Reminder()
+        past = arrow.get('2024-02-04 11:00:00')
+
+        reminder.add("Daily Task", past, recurring=True, interval='daily')
+
+        assert len(reminder.check_due()) == 1
+        assert reminder.reminders[0]['remind_at'].day == 5
+
+    @freeze_time("2024-02-07 12:00:00")
+    def test_check_due_skips_cancelled(self):
+        reminder = Reminder()
+        past = arrow.get('2024-02-07 11:00:00')
+
+        reminder.add("Meeting", past)
+        reminder.cancel("Meeting")
+
+        assert reminder.check_due() == []
+
+    def test_seconds_until_next(self):
+        reminder = Reminder()
+        now = arrow.get('2024-02-07 12:00:00')
+
+        assert reminder.seconds_until_next(now=now) == float('inf')
+
+        reminder.add("Meeting", now.shift(minutes=5))
+        reminder.add("Overdue", now.shift(minutes=-5))
+
+        assert reminder.seconds_until_next(now=now) == 0.0
+
+        reminder.cancel("Overdue")
+
+        assert reminder.seconds_until_next(now=now) == 300.0
+
+    @freeze_time("2024-02-07 12:00:00")
+    def test_check_due_after_reactivation(self):
+        reminder = Reminder()
+        past = arrow.get('2024-02-07 11:00:00')
+
+        reminder.add("Meeting", past)
+        reminder.cancel("Meeting")
+        assert reminder.check_due() == []
+
+        reminder.reactivate(reminder.reminders[0])
+
+        assert reminder.check_due() == [reminder.reminders[0]]
+        assert reminder.seconds_until_next() == float('inf')
+
+    @freeze_time("2024-02-07 12:00:00")
+    def test_check_due_after_reschedule(self):
+        reminder = Reminder()
+        reminder.add("Meeting", arrow.get('2024-02-07 14:00:00'))
+        reminder.add("Lunch", arrow.get('2024-02-07 11:00:00'))
+
+        first, second = reminder.reminders
+        reminder.reschedule(first, arrow.get('2024-02-07 11:30:00'))
+        reminder.reschedule(second, arrow.get('2024-02-07 13:00:00'))
+
+        assert reminder.check_due() == [reminder.reminders[0]]
+        assert reminder.seconds_until_next() == 3600.0
+
+    def test_cancelled_and_rescheduled_entries_do_not_pile_up(self):
+        reminder = Reminder()
+        future = arrow.get('2024-02-07 14:00:00')
+
+        for i in range(100):
+            reminder.add(f"r{i}", future.shift(minutes=i))
+        for i in range(99):
+            reminder.cancel(f"r{i}")
+        last = reminder.reminders[-1]
+        for i in range(100):
+            reminder.reschedule(last, future.shift(hours=1, minutes=i))
+
+        assert len(reminder._heap) <= 2
+        assert reminder.check_due(now=future.shift(hours=3)) == [last]
+
     def test_cancel_reminder(self):
         reminder = Reminder()
         future = arrow.utcnow().shift(hours=2)
@@ -109,6 +250,18 @@ class TestReminder:
         assert result is True
         assert len(reminder.list_active()) == 0
 
+    def test_cancel_duplicate_titles_one_at_a_time(self):
+        reminder = Reminder()
+        future = arrow.utcnow().shift(hours=2)
+
+        reminder.add("Meeting", future)
+        reminder.add("Meeting", future.shift(hours=1))
+
+        assert reminder.cancel("Meeting") is True
+        assert reminder.list_active() == [reminder.reminders[1]]
+        assert reminder.cancel("Meeting") is True
+        assert reminder.cancel("Meeting") is False
+
     def test_cancel_nonexistent_reminder(self):
         reminder = Reminder()
 
@@ -148,6 +301,21 @@ class TestTaskScheduler:
         assert len(scheduler.tasks) == 1
         assert scheduler.tasks[0]['type'] == 'weekly'
 
+    @freeze_time("2024-02-07 12:00:00")
+    def test_only_weekly_tasks_have_day(self):
+        scheduler = TaskScheduler()
+
+        def task():
+            pass
+
+        scheduler.add_daily_task("daily", 2, 0, task)
+        scheduler.add_weekly_task("weekly", 0, 2, 0, task)
+
+        daily, weekly = scheduler.list_tasks()
+
+        assert 'day' not in daily
+        assert weekly['day'] == 0
+
     def test_list_tasks(self):
         scheduler = TaskScheduler()
 
@@ -161,6 +329,22 @@ class TestTaskScheduler:
 
         assert len(tasks) == 2
 
+    @freeze_time("2024-02-07 12:00:00")
+    def test_list_tasks_by_next_run(self):
+        scheduler = TaskScheduler()
+
+        def task():
+            pass
+
+        scheduler.add_daily_task("late", 16, 0, task)
+        scheduler.add_daily_task("tomorrow", 9, 0, task)
+        scheduler.add_daily_task("early", 14, 0, task)
+        scheduler.tasks[0]['active'] = False
+
+        names = [t['name'] for t in scheduler.list_tasks()]
+
+        assert names == ["early", "tomorrow"]
+
     @freeze_time("2024-02-07 12:00:00")
     def test_get_next_task(self):
         scheduler = TaskScheduler()
@@ -175,9 +359,97 @@ class TestTaskScheduler:
 
         assert next_task['name'] == "task1"
 
+    @freeze_time("2024-02-07 12:00:00")
+    def test_get_next_task_skips_inactive(self):
+        scheduler = TaskScheduler()
+
+        def task():
+            pass
+
+        scheduler.add_daily_task("task1", 14, 0, task)
+        scheduler.add_daily_task("task2", 16, 0, task)
+        scheduler.tasks[0]['active'] = False
+
+        next_task = scheduler.get_next_task()
+
+        assert next_task['name'] == "task2"
+
+    @freeze_time("2024-02-07 12:00:00")
+    def test_get_next_task_after_reschedule(self):
+        scheduler = TaskScheduler()
+
+        def task():
+            pass
+
+        scheduler.add_daily_task("task1", 14, 0, task)
+        scheduler.add_daily_task("task2", 16, 0, task)
+        task1 = scheduler.tasks[0]
+        scheduler.reschedule(task1, task1['next_run'].shift(days=1))
+
+        assert scheduler.get_next_task()['name'] == "task2"
+        assert [t['name'] for t in scheduler.list_tasks()] == [
+            "task2", "task1",
+        ]
+
+    @freeze_time("2024-02-07 12:00:00")
+    def test_next_run_ts(self):
+        scheduler = TaskScheduler()
+
+        def task():
+            pass
+
+        scheduler.add_daily_task("task1", 14, 0, task)
+        task_info = scheduler.list_tasks()[0]
+
+        assert task_info['next_run_ts'] == task_info['next_run'].int_timestamp
+
+    @freeze_time("2024-02-07 12:00:00")
+    def test_next_run_ts_follows_reschedule(self):
+        scheduler = TaskScheduler()
+
+        def task():
+            pass
+
+        scheduler.add_daily_task("task1", 14, 0, task)
+        task_info = scheduler.tasks[0]
+        scheduler.reschedule(task_info, task_info['next_run'].shift(days=1))
+
+        assert task_info['next_run_ts'] == task_info['next_run'].int_timestamp
+
     def test_get_next_task_empty(self):
         scheduler = TaskScheduler()
 
         next_task = scheduler.get_next_task()
 
         assert next_task is None
+
+    @freeze_time("2024-02-07 12:00:00")
+    def test_seconds_until_next(self):
+        scheduler = TaskScheduler()
+
+        def task():
+            pass
+
+        assert scheduler.seconds_until_next() == float('inf')
+
+        scheduler.add_daily_task("task1", 14, 0, task)
+
+        assert scheduler.seconds_until_next() == 7200.0
+
+    @freeze_time("2024-02-07 12:00:00")
+    def test_seconds_until_next_after_reschedule(self):
+        scheduler = TaskScheduler()
+
+        def task():
+            pass
+
+        scheduler.add_daily_task("task1", 14, 0, task)
+        scheduler.add_daily_task("task2", 16, 0, task)
+        task1 = scheduler.tasks[0]
+        scheduler.reschedule(task1, task1['next_run'].shift(days=1))
+
+        assert scheduler.seconds_until_next() == 4 * 3600.0
+
+        scheduler.tasks[1]['active'] = False
+
+        assert scheduler.seconds_until_next() == 26 * 3600.0
@@ -2,17 +2,23 @@
 Tests for timestamp tool functions.
 """
 
+import os
+
+import numpy as np
 import pytest
 from freezegun import freeze_time
 
 import arrow
+from utils import timestamp_tools
 from utils.timestamp_tools import (
     datetime_to_timestamp,
     generate_timestamp,
     generate_timestamped_filename,
     generate_unique_id,
     parse_timestamp_filename,
+    parse_timestamp_filenames,
     timestamp_to_datetime,
+    timestamps_to_datetimes,
 )
 
 
@@ -62,6 +68,37 @@ class TestTimestampToDatetime:
 
         assert dt.year == 2024
 
+    def test_fractional_milliseconds(self):
+        dt = timestamp_to_datetime(1707318645250, 'milliseconds')
+
+        assert dt.microsecond == 250000
+
+    def test_array_of_timestamps(self):
+        seconds = np.array([1707318645, 0])
+        millis = np.array([1707318645250, 0])
+        floats = np.array([1707318645.25, 0.0])
+
+        for values, unit in ((seconds, 'seconds'), (millis, 'milliseconds'),
+                             (floats, 'seconds')):
+            expected = [
+                timestamp_to_datetime(value, unit) for value in values.tolist()
+            ]
+
+            assert timestamps_to_datetimes(values, unit) == expected
+
+    def test_array_reads_large_seconds_like_scalar(self):
+        values = np.array([1707318645250, 1707318645250123, 1707318645])
+        expected = [timestamp_to_datetime(v) for v in values.tolist()]
+
+        assert timestamps_to_datetimes(values) == expected
+        assert expected[0].microsecond == 250000
+
+    def test_array_out_of_range_raises(self):
+        for values in (np.array([0, -10**12]), np.array([10**18]),
+                       np.array([253402300800]), np.array([np.nan])):
+            with pytest.raises(ValueError, match="out of range"):
+                timestamps_to_datetimes(values)
+
 
 class TestDatetimeToTimestamp:
     def test_to_seconds(self):
@@ -92,6 +129,28 @@ class TestGenerateUniqueId:
 
         assert id1 != id2
 
+    @pytest.mark.skipif(not hasattr(os, 'fork'), reason="needs os.fork")
+    def test_forked_process_gets_own_seed(self):
+        read_end, write_end = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.write(write_end, timestamp_tools._ID_SEED.encode())
+            os._exit(0)
+
+        os.close(write_end)
+        os.waitpid(pid, 0)
+        with os.fdopen(read_end) as pipe:
+            child_seed = pipe.read()
+
+        assert child_seed
+        assert child_seed != timestamp_tools._ID_SEED
+
+    @freeze_time("2024-02-07 14:30:45")
+    def test_unique_ids_with_frozen_clock(self):
+        ids = {generate_unique_id() for _ in range(100)}
+
+        assert len(ids) == 100
+
 
 class TestParseTimestampFilename:
     def test_parse_valid_filename(self):
@@ -121,6 +180,31 @@ class TestParseTimestampFilename:
 
         assert dt is not None
 
+    def test_parse_out_of_range_timestamp(self):
+        filename = 'backup_20241399_143045.zip'
+        dt = parse_timestamp_filename(filename)
+
+        assert dt is None
+
+
+class TestParseTimestampFilenames:
+    def test_matches_single_parse(self):
+        filenames = [
+            'backup_20240207_143045.zip',
+            'backup_invalid.zip',
+            'backup_20240101_120000_20240207_143045.zip',
+            '',
+            'backup_20241399_143045.zip',
+            'log_20240208_000000',
+        ]
+
+        results = parse_timestamp_filenames(filenames)
+
+        assert results == [parse_timestamp_filename(f) for f in filenames]
+
+    def test_empty_list(self):
+        assert parse_timestamp_filenames([]) == []
+
 
 class TestGenerateTimestampedFilename:
     @freeze_time("2024-02-07 14:30:45")
@@ -148,3 +232,9 @@ class TestGenerateTimestampedFilename:
         )
 
         assert result == 'report_2024-02-07.pdf'
+
+    @freeze_time("2024-02-07 14:30:45")
+    def test_format_without_strftime_equivalent(self):
+        result = generate_timestamped_filename('report', '.pdf', 'MMM-YYYY')
+
+        assert result == 'report_Feb-2024.pdf'
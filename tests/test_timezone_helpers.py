@@ -2,6 +2,8 @@
 Tests for timezone helper functions.
 """
 
+import time
+
 import pytest
 
 import arrow
@@ -10,10 +12,22 @@ from utils.timezone_helpers import (
     get_local_timezone,
     get_timezone_offset,
     get_world_times,
+    get_zone,
     is_dst,
 )
 
 
+class TestGetZone:
+    def test_named_zone_is_cached(self):
+        assert get_zone('Europe/London') is get_zone('Europe/London')
+
+    def test_matches_arrow_resolution(self):
+        dt = arrow.get('2024-07-01 12:00:00')
+
+        assert dt.to(get_zone('Asia/Tokyo')) == dt.to('Asia/Tokyo')
+        assert dt.to(get_zone('US/Pacific')).hour == 5
+
+
 class TestConvertTimezone:
     def test_utc_to_new_york(self):
         utc = arrow.get('2024-02-07 12:00:00', tzinfo='UTC')
@@ -33,6 +47,19 @@ class TestConvertTimezone:
 
         assert utc.timestamp() == tokyo.timestamp()
 
+    def test_same_zone_returns_input(self):
+        ny = arrow.get('2024-02-07 12:00:00', tzinfo='America/New_York')
+
+        zone = 'America/New_York'
+
+        assert convert_timezone(ny, zone, zone) is ny
+
+    def test_reinterprets_when_from_tz_differs(self):
+        ny = arrow.get('2024-02-07 12:00:00', tzinfo='America/New_York')
+        converted = convert_timezone(ny, 'UTC', 'America/New_York')
+
+        assert converted.hour == 7
+
 
 class TestGetLocalTimezone:
     def test_returns_string(self):
@@ -41,6 +68,26 @@ class TestGetLocalTimezone:
         assert isinstance(tz, str)
         assert len(tz) > 0
 
+    @pytest.mark.skipif(
+        not hasattr(time, 'tzset'), reason="needs time.tzset"
+    )
+    def test_follows_system_timezone(self, monkeypatch):
+        utc = arrow.get('2024-02-07 12:00:00')
+
+        try:
+            monkeypatch.setenv('TZ', 'UTC')
+            time.tzset()
+            assert get_local_timezone() == 'UTC'
+            assert convert_timezone(utc, 'UTC', 'local').hour == 12
+
+            monkeypatch.setenv('TZ', 'Asia/Kolkata')
+            time.tzset()
+            assert get_local_timezone() == 'IST'
+            assert convert_timezone(utc, 'UTC', 'local').hour == 17
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
 
 class TestGetTimezoneOffset:
     def test_utc_offset_is_zero(self):
@@ -72,6 +119,29 @@ class TestIsDST:
         utc = arrow.get('2024-07-01', tzinfo='UTC')
         assert is_dst(utc) is False
 
+    def test_around_transition(self):
+        zone = 'America/New_York'
+        before = arrow.get('2024-03-10 06:59:59')
+        after = arrow.get('2024-03-10 07:00:00')
+
+        assert is_dst(before, zone) is False
+        assert is_dst(after, zone) is True
+
+    def test_off_boundary_historical_transition(self):
+        # Amsterdam kept LMT-based offsets, switching at 01:40:28 UTC
+        zone = 'Europe/Amsterdam'
+
+        assert is_dst(arrow.get('1930-05-15 01:40:00'), zone) is False
+        assert is_dst(arrow.get('1930-05-15 01:41:00'), zone) is True
+        assert is_dst(arrow.get('1930-10-05 01:40:00'), zone) is True
+        assert is_dst(arrow.get('1930-10-05 01:41:00'), zone) is False
+
+    def test_explicit_timezone_matches_converted(self):
+        utc = arrow.get('2024-07-01 12:00:00')
+
+        assert is_dst(utc, 'Europe/London') is True
+        assert is_dst(utc, 'Asia/Tokyo') is False
+
 
 class TestGetWorldTimes:
     def test_returns_dict(self):
@@ -96,3 +166,36 @@ class TestGetWorldTimes:
         times = get_world_times(utc, timezones)
 
         assert 'Error' in times['Invalid/Timezone']
+
+    def test_matches_arrow_format(self):
+        dt = arrow.get('2024-07-01 12:34:56')
+        timezones = ['UTC', 'Asia/Kolkata', 'America/St_Johns']
+        times = get_world_times(dt, timezones)
+
+        for tz in timezones:
+            assert times[tz] == dt.to(tz).format('YYYY-MM-DD HH:mm:ss ZZ')
+
+    def test_zones_sharing_an_offset(self):
+        dt = arrow.get('2024-01-15 09:00:00')
+        timezones = ['UTC', 'Europe/London', 'Asia/Tokyo', 'Asia/Seoul']
+        times = get_world_times(dt, timezones)
+
+        assert times['UTC'] == times['Europe/London'] == (
+            '2024-01-15 09:00:00 +00:00'
+        )
+        assert times['Asia/Tokyo'] == times['Asia/Seoul'] == (
+            '2024-01-15 18:00:00 +09:00'
+        )
+
+    def test_offset_around_dst_transition(self):
+        before = arrow.get('2024-03-10 06:30:00')
+        after = arrow.get('2024-03-10 07:30:00')
+
+        zone = 'America/New_York'
+
+        assert get_world_times(before, [zone])[zone] == (
+            '2024-03-10 01:30:00 -05:00'
+        )
+        assert get_world_times(after, [zone])[zone] == (
+            '2024-03-10 03:30:00 -04:00'
+        )
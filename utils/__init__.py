@@ -6,7 +6,11 @@ Reusable helper functions for date/time operations with Arrow.
 
 from utils.date_helpers import (
     age_from_birthdate,
+    age_from_date,
+    business_day_mask,
+    business_days_between,
     days_until,
+    days_until_date,
     get_date_range,
     get_month_dates,
     get_quarter_dates,
@@ -21,20 +25,32 @@ from utils.formatters import (
     format_for_log,
     format_relative,
 )
-from utils.schedulers import Reminder, TaskScheduler, schedule_daily
+from utils.schedulers import (
+    Reminder,
+    ReminderRecord,
+    TaskRecord,
+    TaskScheduler,
+    WeeklyTaskRecord,
+    schedule_daily,
+)
 from utils.timestamp_tools import (
     datetime_to_timestamp,
     generate_timestamp,
     generate_timestamped_filename,
     generate_unique_id,
     parse_timestamp_filename,
+    parse_timestamp_filenames,
     timestamp_to_datetime,
+    timestamp_to_datetime_ms,
+    timestamp_to_datetime_s,
+    timestamps_to_datetimes,
 )
 from utils.timezone_helpers import (
     convert_timezone,
     get_local_timezone,
     get_timezone_offset,
     get_world_times,
+    get_zone,
     is_dst,
 )
 
@@ -42,10 +58,14 @@ __all__ = [
     'get_date_range',
     'is_business_day',
     'next_business_day',
+    'business_days_between',
+    'business_day_mask',
     'get_quarter_dates',
     'get_month_dates',
     'days_until',
+    'days_until_date',
     'age_from_birthdate',
+    'age_from_date',
     'DateFormatter',
     'format_for_filename',
     'format_for_display',
@@ -53,17 +73,25 @@ __all__ = [
     'format_relative',
     'format_for_log',
     'Reminder',
+    'ReminderRecord',
     'TaskScheduler',
+    'TaskRecord',
+    'WeeklyTaskRecord',
     'schedule_daily',
     'generate_timestamp',
     'timestamp_to_datetime',
+    'timestamp_to_datetime_s',
+    'timestamp_to_datetime_ms',
+    'timestamps_to_datetimes',
     'datetime_to_timestamp',
     'generate_unique_id',
     'parse_timestamp_filename',
+    'parse_timestamp_filenames',
     'generate_timestamped_filename',
     'convert_timezone',
     'get_local_timezone',
     'get_timezone_offset',
     'is_dst',
     'get_world_times',
+    'get_zone',
 ]
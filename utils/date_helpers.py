@@ -2,28 +2,130 @@
 Date manipulation utility functions.
 
 Common operations for working with dates using Arrow.
+
+Functions that depend on today's date take an optional ``now``. When
+processing a batch, read ``arrow.utcnow()`` once and pass it to each
+call instead of letting every call read the clock.
 """
 
-from typing import List, Optional
+import datetime
+import time
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
 
 import arrow
+import numpy as np
+from dateutil import tz as dateutil_tz
+
+_STEP_DAYS = {'day': 1, 'week': 7}
+_STEP_MONTHS = {'month': 1, 'year': 12}
+_VALID_STEPS = frozenset(_STEP_DAYS) | frozenset(_STEP_MONTHS)
+
+# Days from each weekday (Monday=0 .. Sunday=6) to the next business day
+_NEXT_BDAY_DELTA = (1, 1, 1, 1, 3, 2, 1)
+
+_VALID_QUARTERS = frozenset({1, 2, 3, 4})
+
+# (start month, end month, end day) for each quarter
+_QUARTER_BOUNDS = ((1, 3, 31), (4, 6, 30), (7, 9, 30), (10, 12, 31))
+
+# Days in each month of a common year
+_MDAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Business days as bits of a week starting Monday (bit 0) .. Sunday (bit 6)
+_BDAY_MASK = 0b0011111
+
+# _BDAY_TAIL[w][r]: business days among r consecutive days from weekday w
+_BDAY_TAIL = tuple(
+    tuple(
+        sum((_BDAY_MASK >> ((weekday + i) % 7)) & 1 for i in range(rem))
+        for rem in range(7)
+    )
+    for weekday in range(7)
+)
+
+# Proleptic ordinal of 1970-01-01, the datetime64 epoch
+_EPOCH_ORDINAL = 719163
+
+
+def _to_ordinals(dates: np.ndarray) -> np.ndarray:
+    """Convert an array of datetime64 values to day ordinals."""
+    return dates.astype('datetime64[D]').astype(np.int64) + _EPOCH_ORDINAL
+
+
+def _offset_seconds(tzinfo: datetime.tzinfo, dt: datetime.datetime) -> float:
+    """Return tzinfo's UTC offset for dt in seconds."""
+    offset = tzinfo.utcoffset(dt)
+    return offset.total_seconds() if offset else 0.0
+
+
+def _in_dst_gap(dates: np.ndarray, tzinfo: datetime.tzinfo) -> np.ndarray:
+    """
+    Flag naive wall times that do not exist in tzinfo (a DST gap).
+
+    A wall time exists when the offset the zone gives it, applied to
+    reach a UTC instant, is also the zone's offset at that instant.
+    """
+    guessed = np.array([_offset_seconds(tzinfo, dt) for dt in dates.tolist()])
+    instants = dates.astype('datetime64[s]').astype(np.int64) - guessed
+    actual = np.array([
+        _offset_seconds(tzinfo, datetime.datetime.fromtimestamp(ts, tzinfo))
+        for ts in instants.tolist()
+    ])
+    missing: np.ndarray = guessed != actual
+    return missing
+
+
+def _skip_dst_gaps(dates: np.ndarray, tzinfo: datetime.tzinfo) -> np.ndarray:
+    """
+    Move wall times that fall in a DST gap forward, like Arrow.range().
+
+    Arrow keeps start as given and steps from the previous, already
+    moved date, so every date after a gap keeps the gap's shift. Only
+    dates found inside a gap are resolved one by one.
+    """
+    dates = dates.copy()
+    i = 1
+
+    while i < len(dates):
+        hits = np.flatnonzero(_in_dst_gap(dates[i:], tzinfo))
+        if not hits.size:
+            break
+
+        i += int(hits[0])
+        wall = dates[i].item().replace(tzinfo=tzinfo)
+        gap = dateutil_tz.resolve_imaginary(wall) - wall
+        dates[i:] += np.timedelta64(gap)
+        i += 1
+
+    return dates
 
 
 def get_date_range(
     start: arrow.Arrow,
     end: arrow.Arrow,
-    step: str = 'day'
-) -> List[arrow.Arrow]:
+    step: str = 'day',
+    as_arrow: bool = True
+) -> Union[List[arrow.Arrow], np.ndarray]:
     """
     Generate list of dates between start and end.
 
+    The range is built as a single NumPy datetime64 array in start's
+    timezone and matches Arrow.range(): month and year steps clamp to
+    the last day of shorter months, and dates in a DST gap move forward.
+
     Args:
         start: Starting date
         end: Ending date
         step: Step interval ('day', 'week', 'month', 'year')
+        as_arrow: Wrap results in Arrow objects (False returns the
+            naive datetime64 array in start's timezone)
 
     Returns:
-        List of Arrow date objects
+        List of Arrow date objects, or a datetime64 array
+
+    Raises:
+        ValueError: If step is invalid
 
     Example:
         >>> start = arrow.get('2024-01-01')
@@ -32,40 +134,64 @@ def get_date_range(
         >>> len(dates)
         5
     """
-    dates = []
-    current = start
-
-    while current <= end:
-        dates.append(current)
-        if step == 'day':
-            current = current.shift(days=1)
-        elif step == 'week':
-            current = current.shift(weeks=1)
-        elif step == 'month':
-            current = current.shift(months=1)
-        elif step == 'year':
-            current = current.shift(years=1)
-        else:
-            raise ValueError(f"Invalid step: {step}")
-
-    return dates
-
-
-def is_business_day(date: arrow.Arrow) -> bool:
+    if step not in _VALID_STEPS:
+        raise ValueError(f"Invalid step: {step}")
+
+    end = end.to(start.tzinfo)
+    start_np = np.datetime64(start.naive, 'us')
+    end_np = np.datetime64(end.naive, 'us')
+
+    if step in _STEP_DAYS:
+        stride = np.timedelta64(_STEP_DAYS[step], 'D')
+        count = max((end_np - start_np) // stride + 1, 0)
+        dates = start_np + np.arange(count) * stride
+    else:
+        month_stride = _STEP_MONTHS[step]
+        span = (end.year - start.year) * 12 + end.month - start.month
+        months = (
+            start_np.astype('datetime64[M]')
+            + np.arange(max(span // month_stride + 1, 0)) * month_stride
+        )
+        month_starts = months.astype('datetime64[D]')
+        month_lengths = (months + 1).astype('datetime64[D]') - month_starts
+        days = np.minimum(start.day, month_lengths.astype(int)) - 1
+        time_of_day = start_np - start_np.astype('datetime64[D]')
+        dates = month_starts + days.astype('timedelta64[D]') + time_of_day
+        dates = dates[dates <= end_np]
+
+    if start.tzinfo.utcoffset(None) is None:
+        # The zone has transitions, so some wall times may not exist
+        dates = _skip_dst_gaps(dates, start.tzinfo)
+        dates = dates[dates <= end_np]
+
+    if not as_arrow:
+        return dates
+
+    return [
+        arrow.Arrow.fromdatetime(dt, start.tzinfo) for dt in dates.tolist()
+    ]
+
+
+def is_business_day(
+    date: Union[arrow.Arrow, np.ndarray]
+) -> Union[bool, np.ndarray]:
     """
     Check if date is a business day (Monday-Friday).
 
     Args:
-        date: Arrow date object to check
+        date: Arrow date object, or array of datetime64 values, to check
 
     Returns:
-        True if business day, False otherwise
+        True if business day, False otherwise (boolean array for arrays)
 
     Example:
         >>> dt = arrow.get('2024-02-07')
         >>> is_business_day(dt)
         True
     """
+    if isinstance(date, np.ndarray):
+        return business_day_mask(date)
+
     return date.weekday() < 5
 
 
@@ -85,15 +211,13 @@ def next_business_day(date: arrow.Arrow) -> arrow.Arrow:
         >>> next_day.format('YYYY-MM-DD')
         '2024-02-12'
     """
-    next_day = date.shift(days=1)
-
-    while not is_business_day(next_day):
-        next_day = next_day.shift(days=1)
-
-    return next_day
+    return date.shift(days=_NEXT_BDAY_DELTA[date.weekday()])
 
 
-def get_quarter_dates(year: int, quarter: int) -> tuple:
+def get_quarter_dates(
+    year: int,
+    quarter: int
+) -> Tuple[arrow.Arrow, arrow.Arrow]:
     """
     Get start and end dates for a quarter.
 
@@ -112,19 +236,21 @@ def get_quarter_dates(year: int, quarter: int) -> tuple:
         >>> start.format('YYYY-MM-DD')
         '2024-01-01'
     """
-    if quarter not in [1, 2, 3, 4]:
+    if quarter not in _VALID_QUARTERS:
         raise ValueError("Quarter must be 1, 2, 3, or 4")
 
-    start_month = (quarter - 1) * 3 + 1
-    end_month = start_month + 2
+    start_month, end_month, end_day = _QUARTER_BOUNDS[quarter - 1]
 
-    start_date = arrow.get(year, start_month, 1)
-    end_date = arrow.get(year, end_month, 1).ceil('month')
+    start_date = arrow.Arrow(year, start_month, 1)
+    end_date = arrow.Arrow(year, end_month, end_day, 23, 59, 59, 999999)
 
     return start_date, end_date
 
 
-def get_month_dates(year: int, month: int) -> tuple:
+def get_month_dates(
+    year: int,
+    month: int
+) -> Tuple[arrow.Arrow, arrow.Arrow]:
     """
     Get start and end dates for a month.
 
@@ -140,43 +266,148 @@ def get_month_dates(year: int, month: int) -> tuple:
         >>> start.format('YYYY-MM-DD')
         '2024-02-01'
     """
-    start_date = arrow.get(year, month, 1)
-    end_date = start_date.ceil('month')
+    start_date = arrow.Arrow(year, month, 1)
+
+    if month == 2 and (year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)):
+        last_day = 29
+    else:
+        last_day = _MDAYS[month - 1]
+
+    end_date = arrow.Arrow(year, month, last_day, 23, 59, 59, 999999)
 
     return start_date, end_date
 
 
-def days_until(target_date: arrow.Arrow) -> int:
+def business_days_between(start: arrow.Arrow, end: arrow.Arrow) -> int:
+    """
+    Count business days (Monday-Friday) from start to end, inclusive.
+
+    Args:
+        start: First date of the period
+        end: Last date of the period
+
+    Returns:
+        Number of business days in the period (0 if end precedes start)
+
+    Example:
+        >>> start = arrow.get('2024-02-05')
+        >>> end = arrow.get('2024-02-11')
+        >>> business_days_between(start, end)
+        5
+    """
+    days = end.toordinal() - start.toordinal() + 1
+
+    if days <= 0:
+        return 0
+
+    full_weeks, rem = divmod(days, 7)
+
+    return 5 * full_weeks + _BDAY_TAIL[start.weekday()][rem]
+
+
+def business_day_mask(dates: np.ndarray) -> np.ndarray:
+    """
+    Flag which dates in a datetime64 array are business days.
+
+    Args:
+        dates: Array of datetime64 values, e.g. from
+            get_date_range(..., as_arrow=False)
+
+    Returns:
+        Boolean array, True where the date is Monday-Friday
+
+    Example:
+        >>> start = arrow.get('2024-02-09')
+        >>> end = arrow.get('2024-02-12')
+        >>> dates = get_date_range(start, end, as_arrow=False)
+        >>> business_day_mask(dates).tolist()
+        [True, False, False, True]
+    """
+    return np.is_busday(dates.astype('datetime64[D]'))
+
+
+@lru_cache(maxsize=4)
+def _today_ordinal(day_bucket: int) -> int:
+    """Return the proleptic ordinal of a UTC day given as epoch days."""
+    return arrow.Arrow.utcfromtimestamp(day_bucket * 86400).toordinal()
+
+
+def days_until(
+    target_date: Union[arrow.Arrow, np.ndarray],
+    now: Optional[arrow.Arrow] = None
+) -> Union[int, np.ndarray]:
     """
     Calculate days until target date.
 
     Args:
-        target_date: Target date
+        target_date: Target date, or array of datetime64 values
+        now: Reference time (uses current UTC day if None)
 
     Returns:
-        Number of days until target (negative if in past)
+        Number of days until target (negative if in past), as an
+        integer array for array input
 
     Example:
         >>> future = arrow.utcnow().shift(days=5)
         >>> days_until(future)
         5
     """
-    now = arrow.utcnow().floor('day')
-    target = target_date.floor('day')
+    if now is None:
+        today = _today_ordinal(int(time.time()) // 86400)
+    else:
+        today = now.toordinal()
+
+    if isinstance(target_date, np.ndarray):
+        return _to_ordinals(target_date) - today
+
+    return target_date.toordinal() - today
+
+
+def days_until_date(
+    target: Union[datetime.date, int],
+    today: Optional[datetime.date] = None
+) -> int:
+    """
+    Calculate days until a plain date, skipping Arrow entirely.
+
+    Fast path for batch use when callers already hold native dates.
+
+    Args:
+        target: Target date, or its proleptic ordinal
+        today: Reference date (uses current UTC day if None)
+
+    Returns:
+        Number of days until target (negative if in past)
+
+    Example:
+        >>> days_until_date(datetime.date(2024, 2, 12),
+        ...                 today=datetime.date(2024, 2, 7))
+        5
+    """
+    if today is None:
+        today_ordinal = _today_ordinal(int(time.time()) // 86400)
+    else:
+        today_ordinal = today.toordinal()
+
+    if isinstance(target, int):
+        return target - today_ordinal
 
-    delta = target - now
-    return delta.days
+    return target.toordinal() - today_ordinal
 
 
-def age_from_birthdate(birthdate: arrow.Arrow) -> int:
+def age_from_birthdate(
+    birthdate: Union[arrow.Arrow, np.ndarray],
+    now: Optional[arrow.Arrow] = None
+) -> Union[int, np.ndarray]:
     """
     Calculate age from birthdate.
 
     Args:
-        birthdate: Birthdate as Arrow object
+        birthdate: Birthdate as Arrow object, or array of datetime64 values
+        now: Reference time (uses current UTC time if None)
 
     Returns:
-        Age in years
+        Age in years, as an integer array for array input
 
     Raises:
         ValueError: If birthdate is in the future
@@ -187,14 +418,59 @@ def age_from_birthdate(birthdate: arrow.Arrow) -> int:
         >>> age >= 34
         True
     """
-    now = arrow.utcnow()
+    if now is None:
+        now = arrow.utcnow()
+
+    ny, nm, nd = now.year, now.month, now.day
+
+    if isinstance(birthdate, np.ndarray):
+        days = birthdate.astype('datetime64[D]')
+        months = days.astype('datetime64[M]')
+        years = months.astype('datetime64[Y]').astype(np.int64) + 1970
+        month = months.astype(np.int64) % 12 + 1
+        day = (days - months).astype(np.int64) + 1
+        before_birthday = (nm < month) | ((nm == month) & (nd < day))
+        ages: np.ndarray = ny - years - before_birthday.astype(np.int64)
+        if (ages < 0).any():
+            raise ValueError("Birthdate cannot be in the future")
+        return ages
+
+    return age_from_date(birthdate.date(), now.date())
+
+
+def age_from_date(
+    birthdate: datetime.date,
+    today: Optional[datetime.date] = None
+) -> int:
+    """
+    Calculate age from a plain birth date, skipping Arrow entirely.
 
-    if birthdate > now:
-        raise ValueError("Birthdate cannot be in the future")
+    Fast path for batch use when callers already hold native dates.
 
-    age = now.year - birthdate.year
+    Args:
+        birthdate: Birth date
+        today: Reference date (uses current UTC day if None)
+
+    Returns:
+        Age in years
+
+    Raises:
+        ValueError: If birthdate is in the future
+
+    Example:
+        >>> age_from_date(datetime.date(1990, 3, 1),
+        ...               today=datetime.date(2024, 2, 7))
+        33
+    """
+    if today is None:
+        today = datetime.date.fromordinal(
+            _today_ordinal(int(time.time()) // 86400)
+        )
+
+    ny, nm, nd = today.year, today.month, today.day
+    by, bm, bd = birthdate.year, birthdate.month, birthdate.day
 
-    if (now.month, now.day) < (birthdate.month, birthdate.day):
-        age -= 1
+    if (by, bm, bd) > (ny, nm, nd):
+        raise ValueError("Birthdate cannot be in the future")
 
-    return age
+    return ny - by - ((nm, nd) < (bm, bd))
@@ -4,9 +4,62 @@ Date formatting utilities.
 Custom formatters for various use cases.
 """
 
-from typing import Optional
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
 
 import arrow
+from arrow.formatter import DateTimeFormatter
+
+
+@lru_cache(maxsize=64)
+def _compile_format(
+    format_string: str,
+    locale: str = 'en_us'
+) -> Callable[[arrow.Arrow], str]:
+    """
+    Tokenize an Arrow format string once and return a renderer for it.
+
+    Args:
+        format_string: Arrow format string
+        locale: Locale for formatting
+
+    Returns:
+        Function formatting an Arrow object like dt.format(format_string)
+    """
+    formatter = DateTimeFormatter(locale)
+    parts: List[Tuple[bool, str]] = []
+    pos = 0
+
+    for match in DateTimeFormatter._FORMAT_RE.finditer(format_string):
+        if match.start() > pos:
+            parts.append((False, format_string[pos:match.start()]))
+        parts.append((True, match.group(0)))
+        pos = match.end()
+
+    if pos < len(format_string):
+        parts.append((False, format_string[pos:]))
+
+    def render(dt: arrow.Arrow) -> str:
+        value = dt.datetime
+        return ''.join(
+            formatter._format_token(value, text) or '' if is_token else text
+            for is_token, text in parts
+        )
+
+    return render
+
+
+@lru_cache(maxsize=1)
+def _utcnow_at(bucket: int) -> arrow.Arrow:
+    """Return the current UTC time, cached for one 100 ms bucket."""
+    return arrow.utcnow()
+
+
+def _now_bucket() -> arrow.Arrow:
+    """Return the current UTC time, refreshed at most every 100 ms."""
+    return _utcnow_at(time.monotonic_ns() // 10**8)
 
 
 def format_for_filename(dt: Optional[arrow.Arrow] = None) -> str:
@@ -27,7 +80,7 @@ def format_for_filename(dt: Optional[arrow.Arrow] = None) -> str:
     if dt is None:
         dt = arrow.utcnow()
 
-    return dt.format('YYYYMMDD_HHmmss')
+    return _default_formatter.format(dt, 'filename')
 
 
 def format_for_display(
@@ -49,7 +102,10 @@ def format_for_display(
         >>> format_for_display(dt)
         'February 07, 2024 at 2:30 PM'
     """
-    return dt.format('MMMM DD, YYYY [at] h:mm A', locale=locale)
+    if locale == 'en':
+        return _default_formatter.format(dt, 'display')
+
+    return _compile_format('MMMM DD, YYYY [at] h:mm A', locale)(dt)
 
 
 def format_for_api(dt: arrow.Arrow) -> str:
@@ -74,6 +130,9 @@ def format_relative(dt: arrow.Arrow) -> str:
     """
     Format as relative time ('2 hours ago').
 
+    The reference "now" is shared across calls for up to 100 ms, so
+    results can lag the clock by that much.
+
     Args:
         dt: Arrow datetime object
 
@@ -85,7 +144,7 @@ def format_relative(dt: arrow.Arrow) -> str:
         >>> 'ago' in format_relative(past)
         True
     """
-    return dt.humanize()
+    return dt.humanize(other=_now_bucket())
 
 
 def format_for_log(dt: arrow.Arrow) -> str:
@@ -103,7 +162,49 @@ def format_for_log(dt: arrow.Arrow) -> str:
         >>> format_for_log(dt)
         '2024-02-07 14:30:45'
     """
-    return dt.format('YYYY-MM-DD HH:mm:ss')
+    return _default_formatter.format(dt, 'log')
+
+
+def _render_short(d: datetime) -> str:
+    """Render 'YYYY-MM-DD'."""
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
+
+
+def _render_time(d: datetime) -> str:
+    """Render 'HH:mm:ss'."""
+    return f"{d.hour:02d}:{d.minute:02d}:{d.second:02d}"
+
+
+def _render_datetime(d: datetime) -> str:
+    """Render 'YYYY-MM-DD HH:mm:ss'."""
+    return (
+        f"{d.year:04d}-{d.month:02d}-{d.day:02d} "
+        f"{d.hour:02d}:{d.minute:02d}:{d.second:02d}"
+    )
+
+
+def _render_filename(d: datetime) -> str:
+    """Render 'YYYYMMDD_HHmmss'."""
+    return (
+        f"{d.year:04d}{d.month:02d}{d.day:02d}_"
+        f"{d.hour:02d}{d.minute:02d}{d.second:02d}"
+    )
+
+
+_FastRenderer = Optional[Callable[[datetime], str]]
+
+# Built-in templates: (name, Arrow format, fast renderer or None).
+# The fast renderer is used where no token depends on the locale.
+_DEFAULTS: Tuple[Tuple[str, str, _FastRenderer], ...] = (
+    ('short', 'YYYY-MM-DD', _render_short),
+    ('long', 'MMMM DD, YYYY', None),
+    ('time', 'HH:mm:ss', _render_time),
+    ('datetime', 'YYYY-MM-DD HH:mm:ss', _render_datetime),
+    ('iso', 'YYYY-MM-DDTHH:mm:ssZZ', None),
+    ('filename', 'YYYYMMDD_HHmmss', _render_filename),
+    ('log', 'YYYY-MM-DD HH:mm:ss', _render_datetime),
+    ('display', 'MMMM DD, YYYY [at] h:mm A', None),
+)
 
 
 class DateFormatter:
@@ -117,18 +218,32 @@ class DateFormatter:
         '2024-02-07'
     """
 
+    __slots__ = ('_idx', '_fmts', '_renderers', '_fast')
+
     def __init__(self) -> None:
         """Initialize formatter with predefined templates."""
-        self.templates = {
-            'short': 'YYYY-MM-DD',
-            'long': 'MMMM DD, YYYY',
-            'time': 'HH:mm:ss',
-            'datetime': 'YYYY-MM-DD HH:mm:ss',
-            'iso': 'YYYY-MM-DDTHH:mm:ssZZ',
-            'filename': 'YYYYMMDD_HHmmss',
-            'log': 'YYYY-MM-DD HH:mm:ss',
-            'display': 'MMMM DD, YYYY [at] h:mm A',
-        }
+        self._idx = {name: i for i, (name, _, _) in enumerate(_DEFAULTS)}
+        self._fmts = [fmt for _, fmt, _ in _DEFAULTS]
+        self._renderers = [_compile_format(fmt) for fmt in self._fmts]
+        self._fast = [fast for _, _, fast in _DEFAULTS]
+
+    @classmethod
+    def default(cls) -> 'DateFormatter':
+        """
+        Return the shared formatter used by the format_for_* functions.
+
+        Its templates are fixed, so add_template() on it raises
+        TypeError; create a DateFormatter() to add templates.
+
+        Returns:
+            Module-wide DateFormatter instance
+        """
+        return _default_formatter
+
+    @property
+    def templates(self) -> Dict[str, str]:
+        """Template names mapped to their Arrow format strings (a copy)."""
+        return dict(zip(self._idx, self._fmts))
 
     def format(
         self,
@@ -148,10 +263,15 @@ class DateFormatter:
         Raises:
             ValueError: If template not found
         """
-        if template not in self.templates:
+        i = self._idx.get(template)
+        if i is None:
             raise ValueError(f"Unknown template: {template}")
 
-        return dt.format(self.templates[template])
+        fast = self._fast[i]
+        if fast is not None:
+            return fast(dt.datetime)
+
+        return self._renderers[i](dt)
 
     def add_template(self, name: str, format_string: str) -> None:
         """
@@ -161,13 +281,40 @@ class DateFormatter:
             name: Template name
             format_string: Arrow format string
         """
-        self.templates[name] = format_string
-
-    def list_templates(self) -> list:
+        renderer = _compile_format(format_string)
+        i = self._idx.get(name)
+
+        if i is None:
+            self._idx[name] = len(self._fmts)
+            self._fmts.append(format_string)
+            self._renderers.append(renderer)
+            self._fast.append(None)
+        else:
+            self._fmts[i] = format_string
+            self._renderers[i] = renderer
+            self._fast[i] = None
+
+    def list_templates(self) -> List[str]:
         """
         List available templates.
 
         Returns:
             List of template names
         """
-        return list(self.templates.keys())
+        return list(self._idx)
+
+
+class _DefaultDateFormatter(DateFormatter):
+    """The shared formatter behind format_for_*; its templates are fixed."""
+
+    __slots__ = ()
+
+    def add_template(self, name: str, format_string: str) -> None:
+        """Refuse to change templates that format_for_* rely on."""
+        raise TypeError(
+            "The default DateFormatter is shared; create a DateFormatter() "
+            "to add templates"
+        )
+
+
+_default_formatter: DateFormatter = _DefaultDateFormatter()
@@ -2,18 +2,197 @@
 Scheduling and task automation utilities.
 
 Helper functions for scheduling tasks and creating reminders.
+
+Functions and methods that read the clock take an optional ``now``.
+When scheduling or checking many items, read ``arrow.utcnow()`` once
+and pass it to each call instead of letting every call read the clock.
 """
 
-from typing import Callable, Dict, List, Optional
+import bisect
+import heapq
+import itertools
+import time
+from collections.abc import MutableMapping
+from dataclasses import dataclass
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import arrow
 
+from utils.timezone_helpers import get_zone
+
+# Recurrence step for each supported reminder interval
+_REMINDER_INTERVALS: Dict[Optional[str], timedelta] = {
+    'daily': timedelta(days=1),
+    'weekly': timedelta(weeks=1),
+}
+
+
+def _now_in(timezone: str, now: Optional[arrow.Arrow]) -> arrow.Arrow:
+    """Return now, or the current time, in timezone."""
+    if now is not None:
+        return now.to(get_zone(timezone))
+    if timezone == 'UTC':
+        return arrow.utcnow()
+    return arrow.now(get_zone(timezone))
+
+
+class _Record(MutableMapping):
+    """
+    Slotted record that also reads and writes like the dict it replaced.
+
+    Fields are fixed, so keys can be read and assigned but not added or
+    removed.
+    """
+
+    __slots__ = ('_seq',)
+    _keys: Tuple[str, ...] = ()
+    # Insertion order in the scheduler holding the record
+    _seq: int
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._keys = cls._keys + tuple(cls.__dict__.get('__slots__', ()))
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._keys:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self._keys:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        raise TypeError(f"{type(self).__name__} fields cannot be removed")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+@dataclass(eq=False)
+class ReminderRecord(_Record):
+    """
+    A reminder added to Reminder.
+
+    Cancel, reactivate and reschedule it through Reminder's methods;
+    assigning active or remind_at directly does not re-queue it.
+    """
+
+    __slots__ = (
+        'title', 'remind_at', 'recurring', 'interval', 'created_at', 'active',
+    )
+
+    title: str
+    remind_at: arrow.Arrow
+    recurring: bool
+    interval: Optional[str]
+    created_at: arrow.Arrow
+    active: bool
+
+
+@dataclass(eq=False)
+class TaskRecord(_Record):
+    """
+    A daily task added to TaskScheduler.
+
+    Move its next run with TaskScheduler.reschedule(); assigning
+    next_run directly does not re-sort it.
+    """
+
+    __slots__ = (
+        'name', 'type', 'hour', 'minute', 'task', 'timezone', 'next_run',
+        'next_run_ts', 'active',
+    )
+
+    name: str
+    type: str
+    hour: int
+    minute: int
+    task: Callable
+    timezone: str
+    next_run: arrow.Arrow
+    next_run_ts: int
+    active: bool
+
+
+@dataclass(eq=False)
+class WeeklyTaskRecord(TaskRecord):
+    """A weekly task added to TaskScheduler."""
+
+    __slots__ = ('day',)
+
+    day: int
+
+
+def _next_run_at(
+    now: arrow.Arrow,
+    hour: int,
+    minute: int,
+    days_ahead: Optional[int] = None
+) -> arrow.Arrow:
+    """
+    Return the next run at hour:minute in now's timezone.
+
+    With days_ahead None the run is today, or tomorrow if that time has
+    passed; otherwise it is days_ahead days from today.
+    """
+    tzinfo = now.tzinfo
+
+    if tzinfo.utcoffset(None) is None:
+        # The zone has transitions; let Arrow resolve wall-clock shifts
+        next_run = now.replace(hour=hour, minute=minute, second=0)
+        if days_ahead is None:
+            if next_run <= now:
+                next_run = next_run.shift(days=1)
+        else:
+            next_run = next_run.shift(days=days_ahead)
+        return next_run
+
+    if days_ahead is None:
+        passed = (hour, minute, 0) <= (now.hour, now.minute, now.second)
+        days_ahead = 1 if passed else 0
+
+    day = date.fromordinal(now.toordinal() + days_ahead)
+
+    return arrow.Arrow(
+        day.year, day.month, day.day, hour, minute, 0, now.microsecond,
+        tzinfo=tzinfo,
+    )
+
+
+def _is_current(entry: Tuple[float, int, ReminderRecord]) -> bool:
+    """Check that a queued reminder is active and still due at its time."""
+    remind_ts, _, reminder = entry
+    return reminder.active and remind_ts == reminder.remind_at.timestamp()
+
+
+@lru_cache(maxsize=256)
+def _daily_label(hour: int, minute: int) -> str:
+    """Return the 'Daily at HH:MM' description for a schedule."""
+    return f"Daily at {hour:02d}:{minute:02d}"
+
 
 def schedule_daily(
     hour: int,
     minute: int,
     task: Callable,
-    timezone: str = 'UTC'
+    timezone: str = 'UTC',
+    now: Optional[arrow.Arrow] = None
 ) -> Dict[str, str]:
     """
     Schedule task to run daily at specific time.
@@ -23,6 +202,7 @@ def schedule_daily(
         minute: Minute (0-59)
         task: Function to execute
         timezone: Timezone for scheduling
+        now: Reference time (uses current time if None)
 
     Returns:
         Dictionary with schedule information
@@ -34,17 +214,13 @@ def schedule_daily(
         >>> 'next_run' in info
         True
     """
-    now = arrow.now(timezone)
-    next_run = now.replace(hour=hour, minute=minute, second=0)
-
-    if next_run <= now:
-        next_run = next_run.shift(days=1)
+    next_run = _next_run_at(_now_in(timezone, now), hour, minute)
 
     return {
         'task': task.__name__,
-        'schedule': f"Daily at {hour:02d}:{minute:02d}",
+        'schedule': _daily_label(hour, minute),
         'timezone': timezone,
-        'next_run': next_run.isoformat(),
+        'next_run': next_run.isoformat(timespec='seconds'),
     }
 
 
@@ -62,14 +238,30 @@ class Reminder:
 
     def __init__(self) -> None:
         """Initialize reminder system."""
-        self.reminders: List[Dict] = []
+        self.reminders: List[ReminderRecord] = []
+        # Active reminders keyed by insertion order; reactivating an
+        # older reminder sets _active_sorted False until the next listing
+        self._active: Dict[int, ReminderRecord] = {}
+        self._active_sorted = True
+        # Reminders by title, in insertion order (titles need not be
+        # unique); a title held by one reminder maps to it, not a list
+        self._by_title: Dict[
+            str, Union[ReminderRecord, List[ReminderRecord]]
+        ] = {}
+        # (remind_at timestamp, insertion order, reminder) min-heap;
+        # reminders are re-queued when rescheduled or reactivated, and
+        # entries that no longer match their reminder are dropped lazily,
+        # or all at once by _compact() when they outnumber active ones
+        self._heap: List[Tuple[float, int, ReminderRecord]] = []
+        self._seq = itertools.count()
 
     def add(
         self,
         title: str,
         remind_at: arrow.Arrow,
         recurring: bool = False,
-        interval: Optional[str] = None
+        interval: Optional[str] = None,
+        now: Optional[arrow.Arrow] = None
     ) -> None:
         """
         Add a new reminder.
@@ -79,53 +271,112 @@ class Reminder:
             remind_at: When to trigger reminder
             recurring: Whether reminder repeats
             interval: Recurrence interval ('daily', 'weekly')
+            now: Creation time (uses current UTC time if None)
         """
-        reminder = {
-            'title': title,
-            'remind_at': remind_at,
-            'recurring': recurring,
-            'interval': interval,
-            'created_at': arrow.utcnow(),
-            'active': True,
-        }
+        reminder = ReminderRecord(
+            title=title,
+            remind_at=remind_at,
+            recurring=recurring,
+            interval=interval,
+            created_at=arrow.utcnow() if now is None else now,
+            active=True,
+        )
+        reminder._seq = next(self._seq)
         self.reminders.append(reminder)
-
-    def list_active(self) -> List[Dict]:
+        self._active[reminder._seq] = reminder
+        held = self._by_title.setdefault(title, reminder)
+        if isinstance(held, list):
+            held.append(reminder)
+        elif held is not reminder:
+            self._by_title[title] = [held, reminder]
+        self._queue(reminder)
+
+    def list_active(self) -> List[ReminderRecord]:
         """
         List all active reminders.
 
         Returns:
-            List of active reminder dictionaries
+            List of active reminder records
         """
-        return [r for r in self.reminders if r['active']]
+        if not self._active_sorted:
+            self._active = dict(sorted(self._active.items()))
+            self._active_sorted = True
+        return list(self._active.values())
 
-    def check_due(self) -> List[Dict]:
+    def check_due(
+        self,
+        now: Optional[arrow.Arrow] = None
+    ) -> List[ReminderRecord]:
         """
         Check for due reminders.
 
+        Args:
+            now: Reference time (uses current UTC time if None)
+
         Returns:
             List of reminders that are due
         """
-        now = arrow.utcnow()
+        now_ts = time.time() if now is None else now.timestamp()
+        heap = self._heap
         due = []
+        recurring = []
+        fired = set()
+
+        while heap and heap[0][0] <= now_ts:
+            entry = heapq.heappop(heap)
+            reminder = entry[2]
+            if not _is_current(entry) or reminder._seq in fired:
+                continue
+
+            fired.add(reminder._seq)
+            due.append(reminder)
+
+            if not reminder.recurring:
+                reminder.active = False
+                del self._active[reminder._seq]
+            else:
+                recurring.append(entry)
+
+        # Re-queue after the scan so a reminder fires at most once per check
+        for entry in recurring:
+            reminder = entry[2]
+            step = _REMINDER_INTERVALS.get(reminder.interval)
+            if step is None:
+                heapq.heappush(heap, entry)
+            else:
+                reminder.remind_at = reminder.remind_at + step
+                self._queue(reminder)
+
+        self._compact()
+        return due
+
+    def seconds_until_next(self, now: Optional[arrow.Arrow] = None) -> float:
+        """
+        Get seconds until the next active reminder is due.
 
-        for reminder in self.reminders:
-            if reminder['active'] and reminder['remind_at'] <= now:
-                due.append(reminder)
-
-                if not reminder['recurring']:
-                    reminder['active'] = False
-                else:
-                    if reminder['interval'] == 'daily':
-                        reminder['remind_at'] = (
-                            reminder['remind_at'].shift(days=1)
-                        )
-                    elif reminder['interval'] == 'weekly':
-                        reminder['remind_at'] = (
-                            reminder['remind_at'].shift(weeks=1)
-                        )
+        Lets a polling loop sleep until there is work instead of waking
+        at a fixed rate. Poll again right away whenever check_due
+        returned reminders, since handling them may take a while:
 
-        return due
+            while True:
+                if not reminders.check_due():
+                    time.sleep(min(60, reminders.seconds_until_next()))
+
+        Args:
+            now: Reference time (uses current UTC time if None)
+
+        Returns:
+            Seconds until due (0.0 if overdue, inf if nothing is pending)
+        """
+        heap = self._heap
+        while heap and not _is_current(heap[0]):
+            heapq.heappop(heap)
+
+        if not heap:
+            return float('inf')
+
+        now_ts = time.time() if now is None else now.timestamp()
+        return max(0.0, heap[0][0] - now_ts)
 
     def cancel(self, title: str) -> bool:
         """
@@ -137,12 +388,67 @@ class Reminder:
         Returns:
             True if cancelled, False if not found
         """
-        for reminder in self.reminders:
-            if reminder['title'] == title and reminder['active']:
-                reminder['active'] = False
+        held = self._by_title.get(title)
+        if held is None:
+            return False
+
+        for reminder in held if isinstance(held, list) else (held,):
+            if reminder.active:
+                reminder.active = False
+                del self._active[reminder._seq]
+                self._compact()
                 return True
         return False
 
+    def reactivate(self, reminder: ReminderRecord) -> None:
+        """
+        Reactivate a cancelled or fired reminder at its remind_at.
+
+        Args:
+            reminder: Reminder record from this Reminder
+        """
+        if reminder.active:
+            return
+
+        reminder.active = True
+        if self._active and next(reversed(self._active)) > reminder._seq:
+            self._active_sorted = False
+        self._active[reminder._seq] = reminder
+        self._queue(reminder)
+
+    def reschedule(
+        self,
+        reminder: ReminderRecord,
+        remind_at: arrow.Arrow
+    ) -> None:
+        """
+        Move a reminder to a new time.
+
+        Args:
+            reminder: Reminder record from this Reminder
+            remind_at: When to trigger reminder
+        """
+        reminder.remind_at = remind_at
+        if reminder.active:
+            self._queue(reminder)
+            self._compact()
+
+    def _queue(self, reminder: ReminderRecord) -> None:
+        """Queue a reminder at its current remind_at."""
+        heapq.heappush(
+            self._heap,
+            (reminder.remind_at.timestamp(), reminder._seq, reminder),
+        )
+
+    def _compact(self) -> None:
+        """Rebuild the heap once stale entries outnumber active ones."""
+        if len(self._heap) > 2 * len(self._active):
+            self._heap = [
+                (r.remind_at.timestamp(), r._seq, r)
+                for r in self._active.values()
+            ]
+            heapq.heapify(self._heap)
+
 
 class TaskScheduler:
     """
@@ -159,7 +465,11 @@ class TaskScheduler:
 
     def __init__(self) -> None:
         """Initialize task scheduler."""
-        self.tasks: List[Dict] = []
+        self.tasks: List[TaskRecord] = []
+        # (next_run_ts, insertion order, task), kept sorted; a task is
+        # moved by reschedule()
+        self._by_next_run: List[Tuple[int, int, TaskRecord]] = []
+        self._seq = itertools.count()
 
     def add_daily_task(
         self,
@@ -167,7 +477,8 @@ class TaskScheduler:
         hour: int,
         minute: int,
         task: Callable,
-        timezone: str = 'UTC'
+        timezone: str = 'UTC',
+        now: Optional[arrow.Arrow] = None
     ) -> None:
         """
         Add daily scheduled task.
@@ -178,24 +489,22 @@ class TaskScheduler:
             minute: Minute (0-59)
             task: Function to execute
             timezone: Timezone for scheduling
+            now: Reference time (uses current time if None)
         """
-        now = arrow.now(timezone)
-        next_run = now.replace(hour=hour, minute=minute, second=0)
-
-        if next_run <= now:
-            next_run = next_run.shift(days=1)
-
-        task_info = {
-            'name': name,
-            'type': 'daily',
-            'hour': hour,
-            'minute': minute,
-            'task': task,
-            'timezone': timezone,
-            'next_run': next_run,
-            'active': True,
-        }
-        self.tasks.append(task_info)
+        next_run = _next_run_at(_now_in(timezone, now), hour, minute)
+
+        task_info = TaskRecord(
+            name=name,
+            type='daily',
+            hour=hour,
+            minute=minute,
+            task=task,
+            timezone=timezone,
+            next_run=next_run,
+            next_run_ts=next_run.int_timestamp,
+            active=True,
+        )
+        self._push(task_info)
 
     def add_weekly_task(
         self,
@@ -204,7 +513,8 @@ class TaskScheduler:
         hour: int,
         minute: int,
         task: Callable,
-        timezone: str = 'UTC'
+        timezone: str = 'UTC',
+        now: Optional[arrow.Arrow] = None
     ) -> None:
         """
         Add weekly scheduled task.
@@ -216,47 +526,91 @@ class TaskScheduler:
             minute: Minute (0-59)
             task: Function to execute
             timezone: Timezone for scheduling
+            now: Reference time (uses current time if None)
         """
-        now = arrow.now(timezone)
-        next_run = now.replace(hour=hour, minute=minute, second=0)
+        now = _now_in(timezone, now)
 
         days_ahead = day - now.weekday()
         if days_ahead <= 0:
             days_ahead += 7
 
-        next_run = next_run.shift(days=days_ahead)
-
-        task_info = {
-            'name': name,
-            'type': 'weekly',
-            'day': day,
-            'hour': hour,
-            'minute': minute,
-            'task': task,
-            'timezone': timezone,
-            'next_run': next_run,
-            'active': True,
-        }
+        next_run = _next_run_at(now, hour, minute, days_ahead)
+
+        task_info = WeeklyTaskRecord(
+            name=name,
+            type='weekly',
+            day=day,
+            hour=hour,
+            minute=minute,
+            task=task,
+            timezone=timezone,
+            next_run=next_run,
+            next_run_ts=next_run.int_timestamp,
+            active=True,
+        )
+        self._push(task_info)
+
+    def _push(self, task_info: TaskRecord) -> None:
+        """Record a task and slot it in by its next run time."""
+        task_info._seq = next(self._seq)
         self.tasks.append(task_info)
+        bisect.insort(
+            self._by_next_run,
+            (task_info.next_run_ts, task_info._seq, task_info),
+        )
 
-    def list_tasks(self) -> List[Dict]:
+    def list_tasks(self) -> List[TaskRecord]:
         """
         List all active tasks.
 
         Returns:
-            List of active task dictionaries
+            List of active task records, soonest next run first
         """
-        return [t for t in self.tasks if t['active']]
+        return [t for _, _, t in self._by_next_run if t.active]
 
-    def get_next_task(self) -> Optional[Dict]:
+    def seconds_until_next(self, now: Optional[arrow.Arrow] = None) -> float:
+        """
+        Get seconds until the next active task is due.
+
+        Args:
+            now: Reference time (uses current UTC time if None)
+
+        Returns:
+            Seconds until due (0.0 if overdue, inf if nothing is pending)
+        """
+        next_task = self.get_next_task()
+        if next_task is None:
+            return float('inf')
+
+        now_ts = time.time() if now is None else now.timestamp()
+        return max(0.0, next_task.next_run_ts - now_ts)
+
+    def get_next_task(self) -> Optional[TaskRecord]:
         """
         Get next task to run.
 
         Returns:
-            Next task dictionary or None
+            Next task record or None
+        """
+        for _, _, task_info in self._by_next_run:
+            if task_info.active:
+                return task_info
+        return None
+
+    def reschedule(self, task_info: TaskRecord, next_run: arrow.Arrow) -> None:
         """
-        active_tasks = self.list_tasks()
-        if not active_tasks:
-            return None
+        Move a task to a new next run time.
 
-        return min(active_tasks, key=lambda t: t['next_run'])
+        Args:
+            task_info: Task record from this scheduler
+            next_run: When the task should next run
+        """
+        entries = self._by_next_run
+        key = (task_info.next_run_ts, task_info._seq)
+        del entries[bisect.bisect_left(entries, key)]
+
+        task_info.next_run = next_run
+        task_info.next_run_ts = next_run.int_timestamp
+        bisect.insort(
+            entries, (task_info.next_run_ts, task_info._seq, task_info),
+        )
@@ -4,10 +4,46 @@ Timestamp generation and manipulation utilities.
 Functions for working with timestamps and timestamped files.
 """
 
+import bisect
+import itertools
+import os
 import re
-from typing import Optional
+import time
+from datetime import datetime, timezone
+from typing import List, Match, Optional
 
 import arrow
+import numpy as np
+from arrow.constants import MAX_TIMESTAMP, MAX_TIMESTAMP_MS, MAX_TIMESTAMP_US
+
+# Per-process state for generate_unique_id, reset in forked children
+_ID_COUNTER = itertools.count()
+_ID_SEED = ''
+
+
+def _reseed_ids() -> None:
+    """Give the current process its own ID counter and seed."""
+    global _ID_COUNTER, _ID_SEED
+    _ID_COUNTER = itertools.count()
+    _ID_SEED = f"{os.getpid() ^ int(time.time()):x}"
+
+
+_reseed_ids()
+if hasattr(os, 'register_at_fork'):  # not available on Windows
+    os.register_at_fork(after_in_child=_reseed_ids)
+
+# Earliest timestamp Arrow can represent (0001-01-01T00:00:00 UTC)
+_MIN_TIMESTAMP = -62135596800
+
+_FILENAME_TS_RE = re.compile(r'(\d{8})_(\d{6})')
+
+# Arrow format strings with a direct strftime equivalent
+_ARROW_TO_STRFTIME = {
+    'YYYYMMDD_HHmmss': '%Y%m%d_%H%M%S',
+    'YYYY-MM-DD HH:mm:ss': '%Y-%m-%d %H:%M:%S',
+    'YYYY-MM-DD': '%Y-%m-%d',
+    'YYYYMMDD': '%Y%m%d',
+}
 
 
 def generate_timestamp(format_type: str = 'unix') -> str:
@@ -28,16 +64,17 @@ def generate_timestamp(format_type: str = 'unix') -> str:
         >>> isinstance(int(ts), int)
         True
     """
-    now = arrow.utcnow()
-
     if format_type == 'unix':
-        return str(int(now.timestamp()))
-    elif format_type == 'iso':
+        return str(int(time.time()))
+
+    now = datetime.now(timezone.utc)
+
+    if format_type == 'iso':
         return now.isoformat()
     elif format_type == 'filename':
-        return now.format('YYYYMMDD_HHmmss')
+        return now.strftime('%Y%m%d_%H%M%S')
     elif format_type == 'human':
-        return now.format('YYYY-MM-DD HH:mm:ss')
+        return now.strftime('%Y-%m-%d %H:%M:%S')
     else:
         raise ValueError(f"Invalid format_type: {format_type}")
 
@@ -62,9 +99,111 @@ def timestamp_to_datetime(
         2024
     """
     if unit == 'milliseconds':
-        ts = ts / 1000
+        return timestamp_to_datetime_ms(ts)
+
+    return timestamp_to_datetime_s(ts)
+
+
+def timestamp_to_datetime_s(ts: float) -> arrow.Arrow:
+    """
+    Convert a Unix timestamp in seconds to a UTC Arrow datetime.
+
+    Args:
+        ts: Timestamp in seconds
+
+    Returns:
+        Arrow datetime object
+    """
+    return arrow.Arrow.utcfromtimestamp(ts)
+
+
+def timestamp_to_datetime_ms(ts: int) -> arrow.Arrow:
+    """
+    Convert a Unix timestamp in milliseconds to a UTC Arrow datetime.
+
+    Args:
+        ts: Timestamp in milliseconds
+
+    Returns:
+        Arrow datetime object
+    """
+    return arrow.Arrow.utcfromtimestamp(ts / 1000)
+
+
+def _float_seconds_to_micros(seconds: np.ndarray) -> np.ndarray:
+    """Round float seconds to whole microseconds as fromtimestamp() does."""
+    fraction, whole = np.modf(seconds)
+    micros: np.ndarray = whole.astype(np.int64) * 1_000_000
+    micros += np.round(fraction * 1_000_000).astype(np.int64)
+    return micros
+
+
+def timestamps_to_datetimes(
+    timestamps: np.ndarray,
+    unit: str = 'seconds'
+) -> List[arrow.Arrow]:
+    """
+    Convert an array of timestamps to UTC Arrow datetimes.
 
-    return arrow.get(ts)
+    The unit conversion is done once over the whole array. As with
+    timestamp_to_datetime, seconds too large for a date are read as
+    milliseconds or microseconds.
+
+    Args:
+        timestamps: Array of timestamp values
+        unit: Unit ('seconds' or 'milliseconds')
+
+    Returns:
+        List of Arrow datetime objects
+
+    Raises:
+        ValueError: If a timestamp is outside the range Arrow supports
+
+    Example:
+        >>> dts = timestamps_to_datetimes(np.array([0, 1707292800]))
+        >>> [dt.year for dt in dts]
+        [1970, 2024]
+    """
+    values = np.asarray(timestamps)
+    millis = unit == 'milliseconds'
+    seconds = values.astype(np.float64)
+    if millis:
+        seconds /= 1000
+
+    invalid = ~np.isfinite(seconds) | (seconds < _MIN_TIMESTAMP)
+    invalid |= seconds >= MAX_TIMESTAMP_US
+    if invalid.any():
+        raise ValueError(
+            f"Timestamp {values[invalid].tolist()[0]!r} is out of range"
+        )
+
+    # Like arrow.util.normalize_timestamp: too large for seconds means
+    # milliseconds, and too large for milliseconds means microseconds
+    as_micros = seconds >= MAX_TIMESTAMP_MS
+    rescaled = (seconds > MAX_TIMESTAMP) | as_micros
+
+    if values.dtype.kind == 'f':
+        micros = _float_seconds_to_micros(np.where(rescaled, 0, seconds))
+    else:
+        factor = 1000 if millis else 1_000_000
+        micros = np.where(rescaled, 0, values).astype(np.int64) * factor
+
+    if rescaled.any():
+        divisor = np.where(as_micros[rescaled], 1_000_000, 1000)
+        micros[rescaled] = _float_seconds_to_micros(
+            seconds[rescaled] / divisor
+        )
+
+    too_late = micros >= MAX_TIMESTAMP * 1_000_000
+    if too_late.any():
+        raise ValueError(
+            f"Timestamp {values[too_late].tolist()[0]!r} is out of range"
+        )
+
+    return [
+        arrow.Arrow.fromdatetime(moment)
+        for moment in micros.astype('datetime64[us]').tolist()
+    ]
 
 
 def datetime_to_timestamp(
@@ -87,18 +226,20 @@ def datetime_to_timestamp(
         >>> ts > 0
         True
     """
-    ts = int(dt.timestamp())
-
     if unit == 'milliseconds':
-        ts = ts * 1000
+        return dt.int_timestamp * 1000
 
-    return ts
+    return dt.int_timestamp
 
 
 def generate_unique_id() -> str:
     """
     Generate unique timestamp-based ID.
 
+    The ID is the current time in nanoseconds, a per-process counter and
+    a per-process seed, all in hex, so it is unique within the process
+    even when the clock does not advance between calls.
+
     Returns:
         Unique ID string
 
@@ -108,8 +249,7 @@ def generate_unique_id() -> str:
         >>> id1 != id2
         True
     """
-    now = arrow.utcnow()
-    return f"{now.timestamp():.6f}".replace('.', '')
+    return f"{time.time_ns():x}{next(_ID_COUNTER):x}{_ID_SEED}"
 
 
 def parse_timestamp_filename(filename: str) -> Optional[arrow.Arrow]:
@@ -127,20 +267,58 @@ def parse_timestamp_filename(filename: str) -> Optional[arrow.Arrow]:
         >>> dt.format('YYYY-MM-DD')
         '2024-02-07'
     """
-    pattern = r'(\d{8})_(\d{6})'
-    match = re.search(pattern, filename)
+    match = _FILENAME_TS_RE.search(filename)
+
+    return _timestamp_from_match(match) if match else None
 
-    if match:
-        date_str = match.group(1)
-        time_str = match.group(2)
-        combined = f"{date_str}_{time_str}"
 
-        try:
-            return arrow.get(combined, 'YYYYMMDD_HHmmss')
-        except Exception:
-            return None
+def parse_timestamp_filenames(
+    filenames: List[str]
+) -> List[Optional[arrow.Arrow]]:
+    """
+    Extract timestamps from many filenames in one regex pass.
+
+    Args:
+        filenames: Filenames containing timestamps
 
-    return None
+    Returns:
+        Arrow datetime or None for each filename, in order
+
+    Example:
+        >>> names = ['a_20240207_143045.zip', 'notes.txt']
+        >>> [dt and dt.hour for dt in parse_timestamp_filenames(names)]
+        [14, None]
+    """
+    results: List[Optional[arrow.Arrow]] = [None] * len(filenames)
+    starts = list(itertools.accumulate(len(name) + 1 for name in filenames))
+    last = -1
+
+    for match in _FILENAME_TS_RE.finditer('\n'.join(filenames)):
+        i = bisect.bisect_right(starts, match.start())
+        if i != last:  # only the first timestamp in each name counts
+            results[i] = _timestamp_from_match(match)
+            last = i
+
+    return results
+
+
+def _timestamp_from_match(match: Match[str]) -> Optional[arrow.Arrow]:
+    """Build the UTC Arrow for a filename timestamp match."""
+    date_str, time_str = match.groups()
+
+    try:
+        return arrow.Arrow(
+            int(date_str[:4]), int(date_str[4:6]), int(date_str[6:]),
+            int(time_str[:2]), int(time_str[2:4]), int(time_str[4:]),
+        )
+    except ValueError:
+        pass
+
+    # Let Arrow's parser handle the edge cases (e.g. hour 24)
+    try:
+        return arrow.get(match.group(0), 'YYYYMMDD_HHmmss')
+    except Exception:
+        return None
 
 
 def generate_timestamped_filename(
@@ -164,8 +342,12 @@ def generate_timestamped_filename(
         >>> '.zip' in fn
         True
     """
-    now = arrow.utcnow()
-    timestamp = now.format(format_str)
+    strftime_format = _ARROW_TO_STRFTIME.get(format_str)
+
+    if strftime_format is not None:
+        timestamp = datetime.now(timezone.utc).strftime(strftime_format)
+    else:
+        timestamp = arrow.utcnow().format(format_str)
 
     if extension and not extension.startswith('.'):
         extension = f".{extension}"
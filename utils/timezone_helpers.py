@@ -4,9 +4,68 @@ Timezone conversion and manipulation utilities.
 Helper functions for working with timezones using Arrow.
 """
 
+import time
+from datetime import datetime, timedelta, tzinfo
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 import arrow
+from arrow.parser import TzinfoParser
+
+
+def get_zone(tz: str) -> tzinfo:
+    """
+    Resolve a timezone name to a tzinfo, caching named zones.
+
+    Accepts the spellings Arrow does. 'local' is resolved on every call,
+    since the local offset changes with DST and the system setting.
+
+    Args:
+        tz: Timezone name (e.g., 'UTC', 'Europe/London', 'local')
+
+    Returns:
+        The matching tzinfo
+
+    Example:
+        >>> get_zone('Europe/London') is get_zone('Europe/London')
+        True
+    """
+    if tz == 'local':
+        # A snapshot of the current local offset; it changes with DST
+        return TzinfoParser.parse(tz)
+    return _named_zone(tz)
+
+
+@lru_cache(maxsize=512)
+def _named_zone(tz: str) -> tzinfo:
+    """Resolve a timezone name other than 'local' once."""
+    return TzinfoParser.parse(tz)
+
+
+@lru_cache(maxsize=512)
+def _offset_in_window(tz: str, window: int) -> str:
+    """
+    Return a timezone's current UTC offset for a 15-minute window.
+
+    Offsets and transitions fall on 15-minute UTC boundaries, so one
+    lookup per window is exact.
+    """
+    return _format_offset(datetime.now(get_zone(tz)))
+
+
+def _format_offset(local: datetime) -> str:
+    """Format a datetime's UTC offset like Arrow's 'ZZ' token."""
+    return _offset_label(local.utcoffset())
+
+
+@lru_cache(maxsize=64)
+def _offset_label(offset: Optional[timedelta]) -> str:
+    """Return the '+HH:MM' label for a UTC offset (built once per offset)."""
+    total_minutes = int(offset.total_seconds() / 60) if offset else 0
+    sign = '+' if total_minutes >= 0 else '-'
+    hours, minutes = divmod(abs(total_minutes), 60)
+
+    return f"{sign}{hours:02d}:{minutes:02d}"
 
 
 def convert_timezone(
@@ -32,9 +91,16 @@ def convert_timezone(
         'EST'
     """
     if dt.tzinfo is None or str(dt.tzinfo) != from_tz:
-        dt = dt.replace(tzinfo=from_tz)
+        dt = dt.replace(tzinfo=get_zone(from_tz))
+    elif from_tz == to_tz:
+        return dt
+
+    to_zone = get_zone(to_tz)
+    if dt.tzinfo is to_zone:
+        # Already in the target zone; Arrow is immutable, so reuse it
+        return dt
 
-    return dt.to(to_tz)
+    return dt.to(to_zone)
 
 
 def get_local_timezone() -> str:
@@ -49,8 +115,7 @@ def get_local_timezone() -> str:
         >>> isinstance(tz, str)
         True
     """
-    local = arrow.now()
-    return str(local.tzinfo)
+    return str(datetime.now().astimezone().tzinfo)
 
 
 def get_timezone_offset(tz: str) -> str:
@@ -68,8 +133,7 @@ def get_timezone_offset(tz: str) -> str:
         >>> offset in ['-05:00', '-04:00']
         True
     """
-    dt = arrow.now(tz)
-    return dt.format('ZZ')
+    return _offset_in_window(tz, int(time.time()) // 900)
 
 
 def is_dst(dt: arrow.Arrow, tz: Optional[str] = None) -> bool:
@@ -88,10 +152,9 @@ def is_dst(dt: arrow.Arrow, tz: Optional[str] = None) -> bool:
         >>> is_dst(dt)
         True
     """
-    if tz:
-        dt = dt.to(tz)
-
-    return dt.dst().total_seconds() != 0
+    if not tz:
+        return bool(dt.dst())
+    return bool(dt.astimezone(get_zone(tz)).dst())
 
 
 def get_world_times(
@@ -116,11 +179,21 @@ def get_world_times(
         3
     """
     world_times = {}
+    moment = dt.datetime
+    # Zones sharing a UTC offset show the same wall time: render it once
+    rendered: Dict[Optional[timedelta], str] = {}
 
     for tz in timezones:
         try:
-            converted = dt.to(tz)
-            world_times[tz] = converted.format('YYYY-MM-DD HH:mm:ss ZZ')
+            local = moment.astimezone(get_zone(tz))
+            offset = local.utcoffset()
+            label = rendered.get(offset)
+            if label is None:
+                label = rendered[offset] = (
+                    f"{local.strftime('%Y-%m-%d %H:%M:%S')} "
+                    f"{_offset_label(offset)}"
+                )
+            world_times[tz] = label
         except Exception as e:
             world_times[tz] = f"Error: {str(e)}"
 